@@ -1,9 +1,38 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+from functools import cached_property, lru_cache
+from dotenv import load_dotenv
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 import yaml
 import os
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# Read .env into the process environment once; real env vars still win.
+# Settings then only consults os.environ instead of re-parsing the file.
+load_dotenv(".env", override=False)
+
+
+@lru_cache(maxsize=None)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file once per (path, mtime) pair.
+
+    The mtime is part of the cache key so edits on disk invalidate the entry.
+    Callers share the returned dict and should treat it as read-only.
+    """
+    with open(path, "rb") as f:
+        return yaml.load(f.read(), Loader=_YamlLoader)
+
+
+def load_yaml_config(path: str) -> Dict[str, Any]:
+    """Load a YAML config file, reusing the parsed result until it changes."""
+    return _load_yaml_cached(path, os.stat(path).st_mtime_ns)
+
+
 class Settings(BaseSettings):
     """System-wide configuration"""
     
@@ -37,63 +66,112 @@ class Settings(BaseSettings):
     gpt5_reasoning_effort: str = "low"   # minimal|low|medium|high
     gpt5_text_verbosity: str = "low"     # low|medium|high
     
-    # Paths
-    data_dir: Path = Path("data")
-    logs_dir: Path = Path("logs")
-    checkpoint_dir: Path = Path("checkpoints")
+    # Paths (plain strings; use the *_path properties when a Path is needed)
+    data_dir: str = "data"
+    logs_dir: str = "logs"
+    checkpoint_dir: str = "checkpoints"
     
     # Pydantic v2 settings configuration
     model_config = SettingsConfigDict(
-        env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
     )
 
+    # Snapshot of the values last applied by configure_langsmith
+    _last_configured: Optional[Tuple[Any, ...]] = PrivateAttr(default=None)
+    # API key the OpenAI banner was last printed for
+    _announced_api_key: Optional[str] = PrivateAttr(default=None)
+
+    @cached_property
+    def data_path(self) -> Path:
+        return Path(self.data_dir)
+
+    @cached_property
+    def logs_path(self) -> Path:
+        return Path(self.logs_dir)
+
+    @cached_property
+    def checkpoint_path(self) -> Path:
+        return Path(self.checkpoint_dir)
+
     @classmethod
     def load_agent_config(cls) -> Dict[str, Any]:
         """Load agent configuration from YAML"""
-        with open("config/agents.yaml", "r") as f:
-            return yaml.safe_load(f)
+        return load_yaml_config("config/agents.yaml")
     
     @classmethod
     def load_evolution_config(cls) -> Dict[str, Any]:
         """Load evolution parameters from YAML"""
         try:
-            with open("config/evolution.yaml", "r") as f:
-                return yaml.safe_load(f)
+            return load_yaml_config("config/evolution.yaml")
         except FileNotFoundError:
             # Provide a safe default if evolution config is missing
             return {"evolution": {"enabled": False}}
-    
+
     def configure_langsmith(self) -> None:
         """Configure LangSmith and OpenAI environment variables"""
+        key = (
+            self.openai_api_key,
+            self.openai_organization,
+            self.openai_project,
+            self.offline_mode,
+            self.langsmith_tracing,
+            self.langsmith_api_key,
+            self.langsmith_endpoint,
+            self.langsmith_project,
+        )
+        if key == self._last_configured:
+            return
+        self._last_configured = key
+
+        env_updates: Dict[str, str] = {}
+
         # Set OpenAI API key for LangChain (only if not offline)
         if self.openai_api_key and not self.offline_mode:
-            os.environ["OPENAI_API_KEY"] = self.openai_api_key
+            env_updates["OPENAI_API_KEY"] = self.openai_api_key
             if self.openai_organization:
                 # Set common variations for org env var to maximize compatibility
-                os.environ["OPENAI_ORG"] = self.openai_organization
-                os.environ["OPENAI_ORGANIZATION"] = self.openai_organization
+                env_updates["OPENAI_ORG"] = self.openai_organization
+                env_updates["OPENAI_ORGANIZATION"] = self.openai_organization
             if self.openai_project:
-                os.environ["OPENAI_PROJECT"] = self.openai_project
-            print(f"🔑 OpenAI API Key configured: {self.openai_api_key[:8]}...{self.openai_api_key[-4:]}")
+                env_updates["OPENAI_PROJECT"] = self.openai_project
+            if self.openai_api_key != self._announced_api_key:
+                key_str = self.openai_api_key
+                print(f"🔑 OpenAI API Key configured: {key_str[:8]}...{key_str[-4:]}")
+                self._announced_api_key = key_str
         else:
             print("ℹ️ Offline mode enabled or missing API key; skipping OpenAI configuration.")
         
         # Configure LangSmith tracing
-        if self.langsmith_tracing and self.langsmith_api_key:
-            os.environ["LANGSMITH_TRACING"] = "true"
-            os.environ["LANGSMITH_ENDPOINT"] = self.langsmith_endpoint
-            os.environ["LANGSMITH_API_KEY"] = self.langsmith_api_key
+        tracing_enabled = bool(self.langsmith_tracing and self.langsmith_api_key)
+        if tracing_enabled:
+            env_updates["LANGSMITH_TRACING"] = "true"
+            env_updates["LANGSMITH_ENDPOINT"] = self.langsmith_endpoint
+            env_updates["LANGSMITH_API_KEY"] = self.langsmith_api_key
             
             if self.langsmith_project:
-                os.environ["LANGSMITH_PROJECT"] = self.langsmith_project
+                env_updates["LANGSMITH_PROJECT"] = self.langsmith_project
             
             # Optional: Configure additional LangSmith settings
-            os.environ["LANGCHAIN_TRACING_V2"] = "true"
-        else:
+            env_updates["LANGCHAIN_TRACING_V2"] = "true"
+
+        os.environ.update(env_updates)
+
+        if not tracing_enabled:
             # Disable tracing if not configured
             os.environ.pop("LANGSMITH_TRACING", None)
             os.environ.pop("LANGCHAIN_TRACING_V2", None)
 
-settings = Settings()
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, building it on first use."""
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from config.settings import settings` working without paying for
+    # .env parsing and validation at import time.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
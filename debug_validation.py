@@ -1,12 +1,20 @@
 #!/usr/bin/env python3
 """Debug the exact validation flow to find where the dict is coming from"""
 
+import os
+import re
 import sys
+import traceback
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from sefas.agents.checkers import LogicChecker
 
+_TEXT_KEYS = ('content', 'proposal', 'analysis', 'text', 'response', 'description')
+
+# Both confidence phrasings in one alternation so the text is scanned once
+_CONF_RE = re.compile(r'confidence[:\s]+(?P<a>[0-9.]+)|(?P<b>[0-9.]+)\s*confidence')
+
 # Create a checker
 test_config = {
     'role': 'Logic Validation Engine',
@@ -23,51 +31,56 @@ test_dict = {
     'reasoning': 'Based on experimental evidence'
 }
 
-print("🔍 Debugging _extract_confidence call")
-print(f"Input type: {type(test_dict)}")
-print(f"Input content: {test_dict}")
-
+# Collect output and write it once at the end instead of flushing per line
+out = []
 try:
-    # This is exactly what failed in our test
-    result = checker._extract_confidence(test_dict)
-    print(f"✅ Success: {result}")
-except Exception as e:
-    print(f"❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
+    out.append("🔍 Debugging _extract_confidence call")
+    out.append(f"Input type: {type(test_dict)}")
+    out.append(f"Input content: {test_dict}")
+
+    try:
+        # This is exactly what failed in our test
+        result = checker._extract_confidence(test_dict)
+        out.append(f"✅ Success: {result}")
+    except Exception as e:
+        out.append(f"❌ Error: {e}")
+        # Full stack formatting only on request; the exception line is usually enough
+        if os.environ.get("SEFAS_DEBUG_VERBOSE"):
+            out.append(traceback.format_exc().rstrip())
+        else:
+            sys.stderr.write("".join(traceback.format_exception_only(type(e), e)))
     
-    # Let's trace through the method manually
-    print("\n🔧 Manual method execution:")
+        # Let's trace through the method manually
+        out.append("\n🔧 Manual method execution:")
     
-    # Check if it's a dict
-    if isinstance(test_dict, dict):
-        print("✅ Detected as dict")
+        # Check if it's a dict
+        if isinstance(test_dict, dict):
+            out.append("✅ Detected as dict")
         
-        # Check for string content
-        for key in ['content', 'proposal', 'analysis', 'text', 'response', 'description']:
-            if key in test_dict and isinstance(test_dict[key], str):
-                text_str = test_dict[key]
-                print(f"✅ Found string content in '{key}': {text_str}")
-                break
-        else:
-            print("❌ No string content found, would use str(dict)")
-            text_str = str(test_dict)
-    
-    print(f"Text to process: {text_str}")
-    print(f"Type: {type(text_str)}")
+            # Check for string content (one dict lookup per key, first hit wins)
+            found = next(
+                ((key, value) for key in _TEXT_KEYS if isinstance((value := test_dict.get(key)), str)),
+                None,
+            )
+            if found:
+                key, text_str = found
+                out.append(f"✅ Found string content in '{key}': {text_str}")
+            else:
+                out.append("❌ No string content found, would use str(dict)")
+                text_str = str(test_dict)
     
-    # Now try the regex
-    import re
-    patterns = [
-        r'confidence[:\s]+([0-9.]+)',
-        r'([0-9.]+)\s*confidence',
-    ]
+        out.append(f"Text to process: {text_str}")
+        out.append(f"Type: {type(text_str)}")
     
-    for pattern in patterns:
+        # Now try the regex
+        text_str_lower = text_str.lower()
         try:
-            match = re.search(pattern, text_str.lower())
+            match = _CONF_RE.search(text_str_lower)
             if match:
-                print(f"✅ Pattern matched: {pattern} -> {match.group(1)}")
-                break
+                out.append(f"✅ Pattern matched: {_CONF_RE.pattern} -> {match.group('a') or match.group('b')}")
+            else:
+                out.append("❌ No confidence pattern matched")
         except Exception as pattern_error:
-            print(f"❌ Pattern failed: {pattern} -> {pattern_error}")
\ No newline at end of file
+            out.append(f"❌ Pattern failed: {_CONF_RE.pattern} -> {pattern_error}")
+finally:
+    sys.stdout.write("\n".join(out) + "\n")
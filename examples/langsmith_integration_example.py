@@ -1,26 +1,47 @@
 """Example demonstrating LangSmith integration with SEFAS."""
 
 import asyncio
-from datetime import datetime
-from langchain_openai import ChatOpenAI
+import time
+from functools import lru_cache
+
+# SEFAS imports (heavy LangChain/LangSmith modules are imported inside the
+# examples that use them so importing this module stays cheap)
+from config.settings import get_settings
+
+
+@lru_cache(maxsize=1)
+def _get_encoder():
+    """Load the tiktoken encoder once; None if tiktoken is not installed."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(get_settings().llm_model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _fallback_count(text: str) -> int:
+    """Count tokens locally when the provider did not report usage."""
+    encoder = _get_encoder()
+    if encoder is None:
+        return int(len(text.split()) * 1.3)  # Rough estimation
+    return len(encoder.encode(text))
 
-# SEFAS imports
-from sefas.config.settings import settings
-from sefas.monitoring.langsmith_integration import (
-    langsmith_monitor, 
-    AgentTrace, 
-    FederatedTrace
-)
-from sefas.monitoring.metrics import performance_tracker
-from sefas.monitoring.logging import configure_logging, log_agent_execution
 
 async def example_agent_interaction():
     """Example of tracing individual agent interactions."""
+    from langchain_openai import ChatOpenAI
+    from sefas.monitoring.langsmith_integration import langsmith_monitor, AgentTrace
+    from sefas.monitoring.metrics import performance_tracker
+    from sefas.monitoring.logging import configure_logging, log_agent_execution
     
     # Configure logging
     configure_logging(level="INFO")
     
     # Configure LangSmith tracing
+    settings = get_settings()
     settings.configure_langsmith()
     print(f"LangSmith monitoring enabled: {langsmith_monitor.enabled}")
     
@@ -31,21 +52,25 @@ async def example_agent_interaction():
     )
     
     # Simulate agent execution
-    start_time = datetime.now()
+    start = time.perf_counter()
     
     try:
         # This will be traced by LangSmith
-        response = llm.invoke("Analyze the benefits of renewable energy")
+        response = await llm.ainvoke("Analyze the benefits of renewable energy")
         
-        execution_time = (datetime.now() - start_time).total_seconds()
-        tokens_used = len(response.content.split()) * 1.3  # Rough estimation
+        execution_time = time.perf_counter() - start
+        tokens_used = (
+            response.response_metadata.get('token_usage', {}).get('total_tokens')
+            or _fallback_count(response.content)
+        )
+        preview = response.content[:200]
         
         # Create agent trace
         agent_trace = AgentTrace(
             agent_id="proposer_alpha",
             agent_role="proposer_alpha",
             input_data={"query": "Analyze the benefits of renewable energy"},
-            output_data={"response": response.content[:200] + "..."},
+            output_data={"response": preview + "..."},
             execution_time=execution_time,
             tokens_used=int(tokens_used),
             hop_number=1,
@@ -81,12 +106,12 @@ async def example_agent_interaction():
         
         print(f"✅ Agent execution completed in {execution_time:.2f}s")
         print(f"📊 Tokens used: {int(tokens_used)}")
-        print(f"🔗 Response preview: {response.content[:100]}...")
+        print(f"🔗 Response preview: {preview[:100]}...")
         
         return agent_trace
         
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start
         
         # Create failed trace
         agent_trace = AgentTrace(
@@ -107,12 +132,17 @@ async def example_agent_interaction():
 
 async def example_federated_system():
     """Example of tracing a complete federated system execution."""
+    from sefas.monitoring.langsmith_integration import (
+        langsmith_monitor,
+        AgentTrace,
+        FederatedTrace
+    )
+    from sefas.monitoring.metrics import performance_tracker
     
     # Simulate multiple agent interactions
     agent_traces = []
     
     # Orchestrator
-    start_time = datetime.now()
     orchestrator_trace = AgentTrace(
         agent_id="orchestrator",
         agent_role="orchestrator", 
@@ -125,9 +155,10 @@ async def example_federated_system():
     )
     agent_traces.append(orchestrator_trace)
     
-    # Proposer agents
-    for i, proposer in enumerate(["alpha", "beta", "gamma"]):
-        proposer_trace = await example_agent_interaction()
+    # Proposer agents (LLM calls run concurrently)
+    proposers = ["alpha", "beta", "gamma"]
+    proposer_traces = await asyncio.gather(*[example_agent_interaction() for _ in proposers])
+    for i, (proposer, proposer_trace) in enumerate(zip(proposers, proposer_traces)):
         proposer_trace.agent_id = f"proposer_{proposer}"
         proposer_trace.hop_number = i + 1
         agent_traces.append(proposer_trace)
@@ -146,9 +177,18 @@ async def example_federated_system():
         )
         agent_traces.append(checker_trace)
     
-    # Create federated trace
-    total_time = sum(trace.execution_time for trace in agent_traces)
-    total_tokens = sum(trace.tokens_used for trace in agent_traces)
+    # Create federated trace (totals and per-agent contributions in one pass)
+    total_time = 0.0
+    total_tokens = 0
+    agent_contributions = {}
+    for trace in agent_traces:
+        total_time += trace.execution_time
+        total_tokens += trace.tokens_used
+        agent_contributions[trace.agent_id] = {
+            "execution_time": trace.execution_time,
+            "tokens": trace.tokens_used,
+            "success": trace.success
+        }
     
     federated_trace = FederatedTrace(
         task_id="renewable_energy_analysis_001",
@@ -177,13 +217,7 @@ async def example_federated_system():
         tokens_used=federated_trace.total_tokens_used,
         hops_used=federated_trace.total_hops,
         confidence=federated_trace.confidence_score,
-        agent_contributions={
-            trace.agent_id: {
-                "execution_time": trace.execution_time,
-                "tokens": trace.tokens_used,
-                "success": trace.success
-            } for trace in agent_traces
-        }
+        agent_contributions=agent_contributions
     )
     
     print(f"\n🎯 Federated execution completed:")
@@ -197,6 +231,8 @@ async def example_federated_system():
 
 async def example_evolution_tracking():
     """Example of tracking agent evolution."""
+    from sefas.monitoring.langsmith_integration import langsmith_monitor
+    from sefas.monitoring.metrics import performance_tracker
     
     # Simulate evolution event
     evolution_data = {
@@ -220,6 +256,8 @@ async def example_evolution_tracking():
 
 async def example_performance_analysis():
     """Example of analyzing performance metrics."""
+    from sefas.monitoring.langsmith_integration import langsmith_monitor
+    from sefas.monitoring.metrics import performance_tracker
     
     # Get system summary
     summary = performance_tracker.get_system_summary()
@@ -267,7 +305,7 @@ async def main():
     print("\n4. Performance Analysis:")
     await example_performance_analysis()
     
-    print(f"\n✅ Example completed! Check your LangSmith dashboard: {settings.langsmith_endpoint}")
+    print(f"\n✅ Example completed! Check your LangSmith dashboard: {get_settings().langsmith_endpoint}")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -10,23 +10,216 @@ Uses the new GPT-5 Responses API for maximum analytical power.
 import json
 import sys
 import argparse
+import asyncio
+import copy
+import heapq
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+from html.parser import HTMLParser
+from itertools import islice
 import re
+import time
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
+try:
+    from selectolax.parser import HTMLParser as _FastHTML
+except ImportError:  # selectolax is an optional speedup for large HTML reports
+    _FastHTML = None
+
+# HTML reports at least this large go through selectolax when it is installed
+_FAST_HTML_MIN_BYTES = 256 * 1024
+
+# Where the SEFAS runner writes its reports (relative to the working directory,
+# matching FinalReportGenerator's default output_dir)
+REPORTS_DIR = Path("data/reports")
 
 # Add project root to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-try:
-    from openai import OpenAI as _OpenAI
-    from config.settings import settings
-    OPENAI_AVAILABLE = True
-except ImportError as e:
-    print(f"❌ Error importing OpenAI or settings: {e}")
-    print("🔧 Ensure SEFAS environment is active and dependencies installed")
-    sys.exit(1)
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON report, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+# Per-section prompt budgets, in tokens
+_MD_TOKEN_BUDGET = 2000
+_HTML_TOKEN_BUDGET = 1500
+_EXCERPT_TOKEN_BUDGET = 300
+
+# Rough chars-per-token ratio used when tiktoken is unavailable, and a
+# generous upper bound used to size file reads before token truncation
+_CHARS_PER_TOKEN = 4
+_MAX_CHARS_PER_TOKEN = 6
+
+
+@lru_cache(maxsize=1)
+def _get_token_encoding():
+    """Load the GPT-5 tokenizer once; None when tiktoken is not usable"""
+    try:
+        import tiktoken
+        try:
+            return tiktoken.encoding_for_model("gpt-5")
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> Tuple[str, bool]:
+    """Cut text to at most max_tokens tokens; returns (text, was_truncated)"""
+    encoding = _get_token_encoding()
+    if encoding is None:
+        max_chars = max_tokens * _CHARS_PER_TOKEN
+        return text[:max_chars], len(text) > max_chars
+    # Reports are plain text: special-token strings like <|endoftext|> are
+    # encoded as ordinary text instead of raising ValueError
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text, False
+    return encoding.decode(tokens[:max_tokens]), True
+
+
+# Patterns compiled once at import and reused on every report run
+_WS_RE = re.compile(r'\s+')
+_NONWORD_RE = re.compile(r'[^\w\s-]')
+
+
+# Shared executive-consultant instructions; the report-specific brief is
+# inserted between the persona and the deliverables
+_EXECUTIVE_PERSONA = """You are a senior management consultant and AI systems analyst. Your client has deployed a sophisticated SEFAS (Self-Evolving Federated Agent System) - a 17-agent federated intelligence network - to analyze a complex problem.
+
+You have been provided with comprehensive execution data including JSON analytics, Markdown narratives, and HTML reports. Your task is to provide an executive-level analysis that transforms this technical execution data into strategic business intelligence."""
+
+_EXECUTIVE_DELIVERABLES = """Please provide a comprehensive executive analysis that includes:
+
+1. **EXECUTIVE SUMMARY** (3-4 sentences): What was accomplished, how well, and what it means for the organization.
+
+2. **STRATEGIC INSIGHTS** (5-7 key points): The most important findings that leadership should understand, focusing on actionable intelligence rather than technical details.
+
+3. **SOLUTION QUALITY & CONFIDENCE ASSESSMENT**: 
+   - Rate the overall solution quality (Exceptional/Strong/Adequate/Weak)
+   - Assess confidence levels and what drives them
+   - Identify any significant risks or limitations
+
+4. **BUSINESS IMPACT ANALYSIS**:
+   - Immediate implications of these findings
+   - Potential opportunities identified
+   - Risk mitigation recommendations
+
+5. **AGENT SYSTEM PERFORMANCE EVALUATION**:
+   - How effectively the 17-agent network collaborated
+   - Quality of the federated intelligence approach
+   - Recommendations for system optimization
+
+6. **STRATEGIC RECOMMENDATIONS** (4-6 actionable items):
+   - Immediate next steps (0-30 days)
+   - Medium-term actions (1-3 months)
+   - Long-term strategic considerations
+
+7. **CONFIDENCE & RELIABILITY ASSESSMENT**:
+   - How much confidence should leadership have in these results
+   - What additional validation might be needed
+   - When should this analysis be revisited
+
+Format this as a professional consulting report suitable for C-level executives. Focus on business value, strategic implications, and actionable intelligence. Be direct and decisive while acknowledging uncertainties where they exist."""
+
+# Report-specific brief; filled with format_map from _brief_fields
+_ANALYSIS_BRIEF_TMPL = """ANALYSIS SCOPE:
+Task Analyzed: {task}
+Execution ID: {execution_id}
+Agent Network: 17-agent federated system with specialized roles
+Available Data: {formats}
+
+SYSTEM PERFORMANCE OVERVIEW:
+{overview}
+
+COMPREHENSIVE CONTEXT:
+{context}
+
+DETAILED RECOMMENDATIONS FROM AGENTS:
+{recommendations}
+
+AGENT NETWORK PERFORMANCE ANALYSIS:
+{network}"""
+
+# Full single-report prompt, assembled once at import
+_EXECUTIVE_PROMPT_TMPL = f"{_EXECUTIVE_PERSONA}\n\n{_ANALYSIS_BRIEF_TMPL}\n\n{_EXECUTIVE_DELIVERABLES}"
+
+# Offline summary used when the GPT-5 request fails
+_FALLBACK_TMPL = """
+EXECUTIVE SUMMARY: The SEFAS 17-agent network analyzed "{task}" with {confidence:.1f}% overall confidence. System deployment successful with comprehensive multi-agent analysis completed.
+
+STRATEGIC INSIGHTS:
+• Multi-agent federated intelligence system operational and functional
+• {agents} specialized agents contributed to analysis
+• Consensus level: {consensus_level}
+• {rec_count} strategic recommendations generated
+
+SOLUTION QUALITY: {quality} - Based on system confidence metrics and agent consensus
+
+BUSINESS IMPACT: Analysis provides strategic intelligence for decision-making. Recommend review of detailed recommendations for implementation planning.
+
+STRATEGIC RECOMMENDATIONS:
+1. Review detailed agent recommendations for actionable insights
+2. Consider confidence levels when prioritizing implementation
+3. Monitor system performance for continuous improvement
+4. Validate findings through additional analysis if needed
+
+CONFIDENCE ASSESSMENT: System demonstrates {confidence:.1f}% confidence in analysis. Recommend treating as strategic input for further planning and validation.
+"""
+
+# Batch prompting: one shared instruction block, numbered Q[i] briefs, A[i] answers
+_BATCH_INSTRUCTIONS = """You will receive {count} independent SEFAS executions, labelled Q[1] to Q[{count}]. Analyze each one separately, following the deliverables below for every execution. Begin each analysis on its own line with its label (A[1]:, A[2]:, ...) and do not refer to the other executions."""
+
+_BATCH_ANSWER_RE = re.compile(r'^\s*\**A\[(\d+)\]\**\s*:?', re.MULTILINE)
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """Collect the text of an HTML document in one pass.
+
+    Tags are dropped and whitespace runs collapse to a single space as the
+    data arrives, so no second pass over the document is needed. Collection
+    stops once more than ``limit`` characters have been gathered.
+    """
+
+    def __init__(self, limit: int):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.length = 0
+        self._parts: List[str] = []
+        self._pending_space = False
+
+    @property
+    def full(self) -> bool:
+        return self.length > self.limit
+
+    def handle_data(self, data: str) -> None:
+        if self.full or not data:
+            return
+        words = data.split()
+        if not words:
+            self._pending_space = True
+            return
+        if self._parts and (self._pending_space or data[0].isspace()):
+            self._parts.append(' ')
+            self.length += 1
+        text = ' '.join(words)
+        self._parts.append(text)
+        self.length += len(text)
+        self._pending_space = data[-1].isspace()
+
+    def text(self) -> str:
+        return ''.join(self._parts)
 
 
 class GPT5SynthesisAgent:
@@ -34,6 +227,20 @@ class GPT5SynthesisAgent:
     
     def __init__(self):
         """Initialize GPT-5 client matching SEFAS architecture"""
+        # The OpenAI SDK and project settings are imported here, on first agent
+        # creation, so argument parsing and report discovery do not pay for them
+        try:
+            from openai import AsyncOpenAI as _OpenAI
+            from config.settings import settings
+        except ImportError as e:
+            # Raised rather than exiting so in-process callers can carry on without synthesis
+            raise ImportError(f"Error importing OpenAI or settings: {e}") from e
+        
+        # Status lines are queued and written once per phase
+        self._log_buf: List[str] = []
+        # Where _save_executive_report last wrote a report (None if it failed)
+        self.last_report_path: Optional[Path] = None
+        
         # Match SEFAS ResponsesShim pattern for GPT-5
         client_kwargs = {}
         if settings.openai_organization:
@@ -48,34 +255,138 @@ class GPT5SynthesisAgent:
         self.reasoning_effort = "high"    # Maximum reasoning for complex analysis
         self.text_verbosity = "high"      # Comprehensive detailed output
         
-        print("✅ GPT-5 Synthesis Agent initialized with Responses API (matching SEFAS architecture)")
+        self._log("✅ GPT-5 Synthesis Agent initialized with Responses API (matching SEFAS architecture)")
+        self._flush_log()
+    
+    def _log(self, message: str) -> None:
+        """Queue a status line for the next _flush_log"""
+        self._log_buf.append(message)
     
-    def analyze_reports(self, report_paths: Dict[str, str]) -> str:
+    def _flush_log(self) -> None:
+        """Write all queued status lines with a single stdout write"""
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            sys.stdout.flush()
+            self._log_buf.clear()
+    
+    async def analyze_reports(self, report_paths: Dict[str, str], preloaded_json: Optional[Dict[str, Any]] = None,
+                              task_id: Optional[str] = None) -> str:
         """
         Analyze SEFAS reports using GPT-5's advanced reasoning
         
         Args:
             report_paths: Dict with 'json', 'html', 'md' keys pointing to report files
+            preloaded_json: Already-parsed contents of the JSON report, if the
+                caller has it, so the file is not parsed a second time
+            task_id: Task the reports belong to; when given, the saved report is
+                named after it so callers can find it with a task-scoped glob
             
         Returns:
             Comprehensive executive synthesis report
         """
-        print("🧠 Analyzing SEFAS reports with GPT-5...")
+        self._log("🧠 Analyzing SEFAS reports with GPT-5...")
         
         # Extract comprehensive data from all available reports
-        analysis_data = self._extract_comprehensive_data(report_paths)
+        analysis_data = self._extract_comprehensive_data(report_paths, preloaded_json)
         
         # Generate GPT-5 executive synthesis using high reasoning
-        print("🎯 Generating GPT-5 executive synthesis with high reasoning...")
-        synthesis = self._generate_gpt5_executive_analysis(analysis_data)
+        self._log("🎯 Generating GPT-5 executive synthesis with high reasoning...")
+        self._flush_log()
+        synthesis = await self._generate_gpt5_executive_analysis(analysis_data)
         
         # Format and save comprehensive report
         executive_report = self._format_executive_report(analysis_data, synthesis)
-        self._save_executive_report(report_paths, executive_report, analysis_data)
+        self._save_executive_report(report_paths, executive_report, analysis_data, task_id)
+        self._flush_log()
         
         return executive_report
     
-    def _extract_comprehensive_data(self, report_paths: Dict[str, str]) -> Dict[str, Any]:
+    async def analyze_reports_concurrently(self, report_paths_list: List[Dict[str, str]]) -> List[Tuple[str, Optional[Path]]]:
+        """
+        Analyze several SEFAS runs with one GPT-5 request each, issued concurrently
+        
+        Use this instead of analyze_reports_batch when every run needs its own
+        independent response; network and queueing latency still overlap.
+        
+        Each run's report is named after its own execution_id, and each call
+        works on a shallow copy of the agent: the client is shared, while the
+        status-line buffer and last_report_path belong to that run alone.
+        
+        Args:
+            report_paths_list: One report_paths dict (as for analyze_reports) per run
+            
+        Returns:
+            One (executive report, saved report path or None) pair per entry,
+            in the same order
+        """
+        async def analyze_one(paths: Dict[str, str]) -> Tuple[str, Optional[Path]]:
+            worker = copy.copy(self)
+            worker._log_buf = []
+            executive_report = await worker.analyze_reports(paths)
+            return executive_report, worker.last_report_path
+        
+        return list(await asyncio.gather(*[analyze_one(paths) for paths in report_paths_list]))
+    
+    async def analyze_reports_batch(self, report_paths_list: List[Dict[str, str]]) -> List[Tuple[str, Optional[Path]]]:
+        """
+        Analyze several SEFAS runs with a single GPT-5 request
+        
+        The executive instructions are sent once and each run becomes a
+        numbered Q[i] block, so the shared prompt cost is paid once per batch.
+        
+        Args:
+            report_paths_list: One report_paths dict (as for analyze_reports) per run
+            
+        Returns:
+            One (executive report, saved report path or None) pair per entry,
+            in the same order
+        """
+        self._log(f"🧠 Batch-analyzing {len(report_paths_list)} SEFAS runs with GPT-5...")
+        
+        datasets = [self._extract_comprehensive_data(paths) for paths in report_paths_list]
+        
+        briefs = "\n\n".join(
+            f"Q[{i}]:\n{self._build_analysis_brief(data)}" for i, data in enumerate(datasets, 1)
+        )
+        batch_prompt = (
+            f"{_EXECUTIVE_PERSONA}\n\n"
+            f"{_BATCH_INSTRUCTIONS.format(count=len(datasets))}\n\n"
+            f"{briefs}\n\n"
+            f"{_EXECUTIVE_DELIVERABLES}"
+        )
+        
+        self._log("🎯 Generating GPT-5 executive synthesis with high reasoning...")
+        self._flush_log()
+        try:
+            answers = self._split_batch_answers(await self._request_gpt5(batch_prompt), len(datasets))
+        except Exception as e:
+            self._log(f"⚠️ GPT-5 batch analysis failed: {e}")
+            answers = {}
+        
+        executive_reports = []
+        for i, (paths, data) in enumerate(zip(report_paths_list, datasets), 1):
+            synthesis = answers.get(i) or self._fallback_executive_analysis(data)
+            executive_report = self._format_executive_report(data, synthesis)
+            report_path = self._save_executive_report(paths, executive_report, data)
+            executive_reports.append((executive_report, report_path))
+        self._flush_log()
+        
+        return executive_reports
+    
+    @staticmethod
+    def _split_batch_answers(output: str, count: int) -> Dict[int, str]:
+        """Split a batched response into its A[i] sections"""
+        markers = list(_BATCH_ANSWER_RE.finditer(output))
+        answers = {}
+        for marker, next_marker in zip(markers, markers[1:] + [None]):
+            index = int(marker.group(1))
+            if 1 <= index <= count:
+                end = next_marker.start() if next_marker else len(output)
+                answers[index] = output[marker.end():end].strip()
+        return answers
+    
+    def _extract_comprehensive_data(self, report_paths: Dict[str, str],
+                                    preloaded_json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Extract all available data from reports for comprehensive analysis"""
         comprehensive_data = {
             'extraction_timestamp': datetime.now().isoformat(),
@@ -88,29 +399,32 @@ class GPT5SynthesisAgent:
         
         # 1. Extract structured JSON data (most detailed)
         if 'json' in report_paths and Path(report_paths['json']).exists():
-            print(f"📊 Extracting JSON data: {report_paths['json']}")
-            comprehensive_data['json_data'] = self._extract_json_data(report_paths['json'])
+            self._log(f"📊 Extracting JSON data: {report_paths['json']}")
+            comprehensive_data['json_data'] = self._extract_json_data(report_paths['json'], preloaded_json)
         
         # 2. Extract Markdown content (human-readable narrative)
         if 'md' in report_paths and Path(report_paths['md']).exists():
-            print(f"📝 Extracting Markdown content: {report_paths['md']}")
+            self._log(f"📝 Extracting Markdown content: {report_paths['md']}")
             comprehensive_data['markdown_content'] = self._extract_markdown_content(report_paths['md'])
         
         # 3. Extract HTML content (rich formatted analysis)
         if 'html' in report_paths and Path(report_paths['html']).exists():
-            print(f"🌐 Extracting HTML content: {report_paths['html']}")
+            self._log(f"🌐 Extracting HTML content: {report_paths['html']}")
             comprehensive_data['html_content'] = self._extract_html_content(report_paths['html'])
         
         return comprehensive_data
     
-    def _extract_json_data(self, json_path: str) -> Dict[str, Any]:
+    def _extract_json_data(self, json_path: str, preloaded: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Extract and structure JSON data for analysis"""
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if preloaded is not None:
+                data = preloaded
+            else:
+                data = _load_json_file(json_path)
             
             # Extract all key sections
             synthesis = data.get('synthesis', {})
+            agent_reports = data.get('agent_reports', ())
             
             structured_data = {
                 'task': synthesis.get('task', 'Unknown task'),
@@ -133,8 +447,8 @@ class GPT5SynthesisAgent:
                 'system_executive_summary': synthesis.get('executive_summary', ''),
                 
                 # Agent reports sample
-                'agent_reports_count': len(data.get('agent_reports', [])),
-                'agent_reports_sample': data.get('agent_reports', [])[:5],  # First 5 for context
+                'agent_reports_count': len(agent_reports),
+                'agent_reports_sample': list(islice(agent_reports, 5)),  # First 5 for context
                 
                 # Summary data
                 'summary': data.get('summary', {}),
@@ -144,129 +458,125 @@ class GPT5SynthesisAgent:
             return structured_data
             
         except Exception as e:
-            print(f"⚠️ Error extracting JSON data: {e}")
+            self._log(f"⚠️ Error extracting JSON data: {e}")
             return {}
     
     def _extract_markdown_content(self, md_path: str) -> str:
         """Extract Markdown content for narrative context"""
         try:
+            if os.path.getsize(md_path) == 0:
+                return ""
+            
+            # Never read more than the token budget could possibly cover
+            max_chars = _MD_TOKEN_BUDGET * _MAX_CHARS_PER_TOKEN
             with open(md_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                content = f.read(max_chars + 1)
             
-            # Return first 8000 chars to avoid token limits
-            return content[:8000] + "..." if len(content) > 8000 else content
+            # Cap at the Markdown token budget to avoid token limits
+            content, truncated = _truncate_tokens(content, _MD_TOKEN_BUDGET)
+            return content + "..." if truncated else content
             
         except Exception as e:
-            print(f"⚠️ Error extracting Markdown: {e}")
+            self._log(f"⚠️ Error extracting Markdown: {e}")
             return ""
     
     def _extract_html_content(self, html_path: str) -> str:
         """Extract HTML content for rich analysis context"""
         try:
-            with open(html_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            size = os.path.getsize(html_path)
+            if size == 0:
+                return ""
             
-            # Extract text content from HTML (simple approach)
-            # Remove HTML tags for text analysis
-            import re
-            text_content = re.sub(r'<[^>]+>', '', content)
-            text_content = re.sub(r'\s+', ' ', text_content).strip()
+            if _FastHTML is not None and size >= _FAST_HTML_MIN_BYTES:
+                # Large report: let selectolax's C parser extract the text in one pass
+                with open(html_path, 'rb') as f:
+                    text_content = _FastHTML(f.read()).text(separator=' ', strip=True)
+            else:
+                # Extract text content from HTML for text analysis, streaming the
+                # file and stopping as soon as enough text has been collected
+                extractor = _HTMLTextExtractor(limit=_HTML_TOKEN_BUDGET * _MAX_CHARS_PER_TOKEN)
+                with open(html_path, 'r', encoding='utf-8') as f:
+                    while not extractor.full:
+                        chunk = f.read(65536)
+                        if not chunk:
+                            break
+                        extractor.feed(chunk)
+                extractor.close()
+                text_content = extractor.text()
             
-            # Return first 6000 chars
-            return text_content[:6000] + "..." if len(text_content) > 6000 else text_content
+            # Cap at the HTML token budget
+            text_content, truncated = _truncate_tokens(text_content, _HTML_TOKEN_BUDGET)
+            return text_content + "..." if truncated else text_content
             
         except Exception as e:
-            print(f"⚠️ Error extracting HTML: {e}")
+            self._log(f"⚠️ Error extracting HTML: {e}")
             return ""
     
-    def _generate_gpt5_executive_analysis(self, comprehensive_data: Dict[str, Any]) -> str:
+    async def _generate_gpt5_executive_analysis(self, comprehensive_data: Dict[str, Any]) -> str:
         """Use GPT-5 Responses API with high reasoning for executive analysis"""
         
-        # Prepare comprehensive context for GPT-5
-        analysis_context = self._prepare_comprehensive_context(comprehensive_data)
-        
         # Create detailed prompt for executive-level analysis
-        executive_prompt = f"""
-You are a senior management consultant and AI systems analyst. Your client has deployed a sophisticated SEFAS (Self-Evolving Federated Agent System) - a 17-agent federated intelligence network - to analyze a complex problem.
-
-You have been provided with comprehensive execution data including JSON analytics, Markdown narratives, and HTML reports. Your task is to provide an executive-level analysis that transforms this technical execution data into strategic business intelligence.
-
-ANALYSIS SCOPE:
-Task Analyzed: {comprehensive_data.get('json_data', {}).get('task', 'Unknown')}
-Execution ID: {comprehensive_data.get('json_data', {}).get('execution_id', 'Unknown')}
-Agent Network: 17-agent federated system with specialized roles
-Available Data: {', '.join(comprehensive_data.get('available_formats', []))}
-
-SYSTEM PERFORMANCE OVERVIEW:
-{self._format_performance_overview(comprehensive_data)}
-
-COMPREHENSIVE CONTEXT:
-{analysis_context}
-
-DETAILED RECOMMENDATIONS FROM AGENTS:
-{self._format_detailed_recommendations(comprehensive_data)}
-
-AGENT NETWORK PERFORMANCE ANALYSIS:
-{self._format_agent_network_analysis(comprehensive_data)}
-
-Please provide a comprehensive executive analysis that includes:
-
-1. **EXECUTIVE SUMMARY** (3-4 sentences): What was accomplished, how well, and what it means for the organization.
-
-2. **STRATEGIC INSIGHTS** (5-7 key points): The most important findings that leadership should understand, focusing on actionable intelligence rather than technical details.
-
-3. **SOLUTION QUALITY & CONFIDENCE ASSESSMENT**: 
-   - Rate the overall solution quality (Exceptional/Strong/Adequate/Weak)
-   - Assess confidence levels and what drives them
-   - Identify any significant risks or limitations
-
-4. **BUSINESS IMPACT ANALYSIS**:
-   - Immediate implications of these findings
-   - Potential opportunities identified
-   - Risk mitigation recommendations
-
-5. **AGENT SYSTEM PERFORMANCE EVALUATION**:
-   - How effectively the 17-agent network collaborated
-   - Quality of the federated intelligence approach
-   - Recommendations for system optimization
-
-6. **STRATEGIC RECOMMENDATIONS** (4-6 actionable items):
-   - Immediate next steps (0-30 days)
-   - Medium-term actions (1-3 months)
-   - Long-term strategic considerations
-
-7. **CONFIDENCE & RELIABILITY ASSESSMENT**:
-   - How much confidence should leadership have in these results
-   - What additional validation might be needed
-   - When should this analysis be revisited
-
-Format this as a professional consulting report suitable for C-level executives. Focus on business value, strategic implications, and actionable intelligence. Be direct and decisive while acknowledging uncertainties where they exist.
-        """
+        executive_prompt = _EXECUTIVE_PROMPT_TMPL.format_map(self._brief_fields(comprehensive_data))
         
         try:
-            # Use GPT-5 Responses API matching SEFAS architecture
-            response = self.client.responses.create(
-                model=self.model,
-                input=executive_prompt,
-                reasoning={"effort": self.reasoning_effort},
-                text={"verbosity": self.text_verbosity}
-            )
-            
-            # Match SEFAS response handling pattern
-            return getattr(response, 'output_text', str(response))
+            return await self._request_gpt5(executive_prompt)
             
         except Exception as e:
-            print(f"⚠️ GPT-5 executive analysis failed: {e}")
+            self._log(f"⚠️ GPT-5 executive analysis failed: {e}")
             return self._fallback_executive_analysis(comprehensive_data)
     
-    def _prepare_comprehensive_context(self, comprehensive_data: Dict[str, Any]) -> str:
-        """Prepare structured context for GPT-5 analysis"""
-        context_sections = []
+    def _build_analysis_brief(self, comprehensive_data: Dict[str, Any]) -> str:
+        """Render the report-specific part of the executive prompt"""
+        return _ANALYSIS_BRIEF_TMPL.format_map(self._brief_fields(comprehensive_data))
+    
+    def _brief_fields(self, comprehensive_data: Dict[str, Any]) -> Dict[str, str]:
+        """Collect the placeholder values for _ANALYSIS_BRIEF_TMPL"""
+        # Prepare every prompt section from a single pass over the report data
+        json_data = comprehensive_data.get('json_data', {})
+        fields = self._build_report_sections(comprehensive_data)
+        fields['task'] = json_data.get('task', 'Unknown')
+        fields['execution_id'] = json_data.get('execution_id', 'Unknown')
+        fields['formats'] = ', '.join(comprehensive_data.get('available_formats', []))
+        return fields
+    
+    async def _request_gpt5(self, prompt: str) -> str:
+        """Send one prompt through the GPT-5 Responses API"""
+        # Use GPT-5 Responses API matching SEFAS architecture
+        response = await self.client.responses.create(
+            model=self.model,
+            input=prompt,
+            reasoning={"effort": self.reasoning_effort},
+            text={"verbosity": self.text_verbosity}
+        )
         
+        # Match SEFAS response handling pattern
+        return getattr(response, 'output_text', str(response))
+    
+    def _build_report_sections(self, comprehensive_data: Dict[str, Any]) -> Dict[str, str]:
+        """Unpack the report data once and render every prompt section from it"""
         json_data = comprehensive_data.get('json_data', {})
+        consensus = json_data.get('consensus', {})
+        performance = json_data.get('performance_metrics', {})
+        recommendations = json_data.get('recommendations', [])
+        
+        return {
+            'context': self._prepare_comprehensive_context(
+                json_data, consensus, performance, comprehensive_data.get('markdown_content', '')
+            ),
+            'overview': self._format_performance_overview(
+                json_data.get('agent_reports_count', 0), consensus, performance, recommendations
+            ),
+            'recommendations': self._format_detailed_recommendations(recommendations),
+            'network': self._format_agent_network_analysis(json_data.get('agent_contributions', {})),
+        }
+    
+    @staticmethod
+    def _prepare_comprehensive_context(json_data: Dict[str, Any], consensus: Dict[str, Any],
+                                       performance: Dict[str, Any], markdown_content: str) -> str:
+        """Prepare structured context for GPT-5 analysis"""
+        context_sections = []
         
         # Consensus and confidence analysis
-        consensus = json_data.get('consensus', {})
         if consensus:
             context_sections.append(
                 f"CONSENSUS ANALYSIS: {consensus.get('mean_confidence', 0):.1%} average confidence, "
@@ -299,7 +609,6 @@ Format this as a professional consulting report suitable for C-level executives.
             )
         
         # Performance metrics
-        performance = json_data.get('performance_metrics', {})
         if performance:
             context_sections.append(
                 f"EXECUTION PERFORMANCE: {performance.get('total_execution_time', 0):.1f}s total time, "
@@ -308,45 +617,40 @@ Format this as a professional consulting report suitable for C-level executives.
             )
         
         # Markdown narrative summary
-        markdown_content = comprehensive_data.get('markdown_content', '')
         if markdown_content:
-            context_sections.append(f"NARRATIVE REPORT EXCERPT: {markdown_content[:1000]}...")
+            excerpt, _ = _truncate_tokens(markdown_content, _EXCERPT_TOKEN_BUDGET)
+            context_sections.append(f"NARRATIVE REPORT EXCERPT: {excerpt}...")
         
         return "\n\n".join(context_sections) if context_sections else "Limited context available"
     
-    def _format_performance_overview(self, comprehensive_data: Dict[str, Any]) -> str:
+    @staticmethod
+    def _format_performance_overview(agent_count: int, consensus: Dict[str, Any],
+                                     performance: Dict[str, Any], recommendations: List[Dict[str, Any]]) -> str:
         """Format high-level performance overview"""
-        json_data = comprehensive_data.get('json_data', {})
-        
         overview_parts = []
         
         # Agent count and roles
-        agent_count = json_data.get('agent_reports_count', 0)
         overview_parts.append(f"• {agent_count} specialized agents deployed")
         
         # Consensus status
-        consensus = json_data.get('consensus', {})
         if consensus:
             confidence = consensus.get('mean_confidence', 0) * 100
             overview_parts.append(f"• {confidence:.1f}% overall system confidence")
             overview_parts.append(f"• Consensus: {'✅ Achieved' if consensus.get('consensus_reached') else '❌ Not reached'}")
         
         # Execution efficiency
-        performance = json_data.get('performance_metrics', {})
         if performance:
             exec_time = performance.get('total_execution_time', 0)
             overview_parts.append(f"• {exec_time:.1f} seconds total analysis time")
         
         # Recommendation count
-        recommendations = json_data.get('recommendations', [])
         overview_parts.append(f"• {len(recommendations)} strategic recommendations generated")
         
         return "\n".join(overview_parts) if overview_parts else "Performance data not available"
     
-    def _format_detailed_recommendations(self, comprehensive_data: Dict[str, Any]) -> str:
+    @staticmethod
+    def _format_detailed_recommendations(recommendations: List[Dict[str, Any]]) -> str:
         """Format recommendations for GPT-5 analysis"""
-        recommendations = comprehensive_data.get('json_data', {}).get('recommendations', [])
-        
         if not recommendations:
             return "No recommendations available"
         
@@ -363,24 +667,23 @@ Format this as a professional consulting report suitable for C-level executives.
         
         return "\n\n".join(formatted_recs)
     
-    def _format_agent_network_analysis(self, comprehensive_data: Dict[str, Any]) -> str:
+    @staticmethod
+    def _format_agent_network_analysis(agent_contributions: Dict[str, Dict[str, Any]]) -> str:
         """Format agent network performance for analysis"""
-        agent_contributions = comprehensive_data.get('json_data', {}).get('agent_contributions', {})
-        
         if not agent_contributions:
             return "Agent network performance data not available"
         
-        # Analyze top performing agents
-        sorted_agents = sorted(
+        # Analyze top performing agents (top 7 only, so a heap beats a full sort)
+        top_agents = heapq.nlargest(
+            7,
             agent_contributions.items(),
-            key=lambda x: x[1].get('confidence', 0),
-            reverse=True
+            key=lambda x: x[1].get('confidence', 0)
         )
         
         network_analysis = []
         network_analysis.append("TOP PERFORMING AGENTS:")
         
-        for agent_id, contrib in sorted_agents[:7]:  # Top 7 agents
+        for agent_id, contrib in top_agents:
             role = contrib.get('role', 'Unknown role')
             confidence = contrib.get('confidence', 0) * 100
             exec_time = contrib.get('execution_time', 0)
@@ -393,8 +696,11 @@ Format this as a professional consulting report suitable for C-level executives.
         
         # Overall network statistics
         total_agents = len(agent_contributions)
-        avg_confidence = sum(contrib.get('confidence', 0) for contrib in agent_contributions.values()) / max(total_agents, 1) * 100
-        total_exec_time = sum(contrib.get('execution_time', 0) for contrib in agent_contributions.values())
+        total_confidence = total_exec_time = 0.0
+        for contrib in agent_contributions.values():
+            total_confidence += contrib.get('confidence', 0)
+            total_exec_time += contrib.get('execution_time', 0)
+        avg_confidence = total_confidence / max(total_agents, 1) * 100
         
         network_analysis.append(f"\nNETWORK STATISTICS:")
         network_analysis.append(f"• {total_agents} agents active")
@@ -406,31 +712,16 @@ Format this as a professional consulting report suitable for C-level executives.
     def _fallback_executive_analysis(self, comprehensive_data: Dict[str, Any]) -> str:
         """Generate fallback analysis when GPT-5 fails"""
         json_data = comprehensive_data.get('json_data', {})
-        task = json_data.get('task', 'Unknown task')
         confidence = json_data.get('consensus', {}).get('mean_confidence', 0) * 100
-        agents = json_data.get('agent_reports_count', 0)
         
-        return f"""
-EXECUTIVE SUMMARY: The SEFAS 17-agent network analyzed "{task}" with {confidence:.1f}% overall confidence. System deployment successful with comprehensive multi-agent analysis completed.
-
-STRATEGIC INSIGHTS:
-• Multi-agent federated intelligence system operational and functional
-• {agents} specialized agents contributed to analysis
-• Consensus level: {'Strong' if confidence >= 70 else 'Moderate' if confidence >= 50 else 'Developing'}
-• {len(json_data.get('recommendations', []))} strategic recommendations generated
-
-SOLUTION QUALITY: {'Strong' if confidence >= 70 else 'Adequate'} - Based on system confidence metrics and agent consensus
-
-BUSINESS IMPACT: Analysis provides strategic intelligence for decision-making. Recommend review of detailed recommendations for implementation planning.
-
-STRATEGIC RECOMMENDATIONS:
-1. Review detailed agent recommendations for actionable insights
-2. Consider confidence levels when prioritizing implementation
-3. Monitor system performance for continuous improvement
-4. Validate findings through additional analysis if needed
-
-CONFIDENCE ASSESSMENT: System demonstrates {confidence:.1f}% confidence in analysis. Recommend treating as strategic input for further planning and validation.
-        """
+        return _FALLBACK_TMPL.format(
+            task=json_data.get('task', 'Unknown task'),
+            confidence=confidence,
+            agents=json_data.get('agent_reports_count', 0),
+            consensus_level='Strong' if confidence >= 70 else 'Moderate' if confidence >= 50 else 'Developing',
+            rec_count=len(json_data.get('recommendations', [])),
+            quality='Strong' if confidence >= 70 else 'Adequate',
+        )
     
     def _format_executive_report(self, comprehensive_data: Dict[str, Any], gpt5_synthesis: str) -> str:
         """Format the complete executive report"""
@@ -438,134 +729,233 @@ CONFIDENCE ASSESSMENT: System demonstrates {confidence:.1f}% confidence in analy
         task = json_data.get('task', 'Unknown task')
         execution_id = json_data.get('execution_id', 'Unknown')
         
+        divider = "=" * 100
+        parts: List[str] = []
+        
         # Header with metadata
-        report = "=" * 100 + "\n"
-        report += "🎯 SEFAS EXECUTIVE INTELLIGENCE REPORT\n"
-        report += "Generated by GPT-5 Advanced Analysis Engine\n"
-        report += "=" * 100 + "\n\n"
+        parts.append(
+            f"{divider}\n"
+            "🎯 SEFAS EXECUTIVE INTELLIGENCE REPORT\n"
+            "Generated by GPT-5 Advanced Analysis Engine\n"
+            f"{divider}\n\n"
+        )
         
         # Executive metadata
-        report += f"📋 ANALYSIS SUBJECT: {task}\n"
-        report += f"🆔 EXECUTION ID: {execution_id}\n"
-        report += f"🤖 AGENT NETWORK: 17-agent federated intelligence system\n"
-        report += f"📊 DATA SOURCES: {', '.join(comprehensive_data.get('available_formats', []))}\n"
-        report += f"🗓️ REPORT GENERATED: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        report += f"⚙️ ANALYSIS ENGINE: GPT-5 with High Reasoning\n\n"
+        parts.append(
+            f"📋 ANALYSIS SUBJECT: {task}\n"
+            f"🆔 EXECUTION ID: {execution_id}\n"
+            "🤖 AGENT NETWORK: 17-agent federated intelligence system\n"
+            f"📊 DATA SOURCES: {', '.join(comprehensive_data.get('available_formats', []))}\n"
+            f"🗓️ REPORT GENERATED: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            "⚙️ ANALYSIS ENGINE: GPT-5 with High Reasoning\n\n"
+        )
         
         # Performance dashboard
         consensus = json_data.get('consensus', {})
         performance = json_data.get('performance_metrics', {})
         
-        report += "📊 EXECUTIVE DASHBOARD\n"
-        report += "-" * 100 + "\n"
+        parts.append(f"📊 EXECUTIVE DASHBOARD\n{'-' * 100}\n")
         
         if consensus:
             confidence = consensus.get('mean_confidence', 0) * 100
             conf_emoji = "🟢" if confidence >= 80 else "🟡" if confidence >= 60 else "🟠" if confidence >= 40 else "🔴"
-            report += f"🎯 System Confidence: {confidence:.1f}% {conf_emoji}\n"
-            report += f"✅ Consensus Status: {'Achieved' if consensus.get('consensus_reached') else 'Developing'}\n"
+            parts.append(f"🎯 System Confidence: {confidence:.1f}% {conf_emoji}\n")
+            parts.append(f"✅ Consensus Status: {'Achieved' if consensus.get('consensus_reached') else 'Developing'}\n")
         
         if performance:
-            report += f"⏱️ Analysis Time: {performance.get('total_execution_time', 0):.1f} seconds\n"
-            report += f"🔢 Computational Cost: ${performance.get('estimated_cost_usd', 0):.4f}\n"
+            parts.append(f"⏱️ Analysis Time: {performance.get('total_execution_time', 0):.1f} seconds\n")
+            parts.append(f"🔢 Computational Cost: ${performance.get('estimated_cost_usd', 0):.4f}\n")
         
         agent_count = json_data.get('agent_reports_count', 0)
         rec_count = len(json_data.get('recommendations', []))
-        report += f"👥 Agents Deployed: {agent_count}\n"
-        report += f"💡 Recommendations: {rec_count}\n\n"
+        parts.append(f"👥 Agents Deployed: {agent_count}\n💡 Recommendations: {rec_count}\n\n")
         
         # GPT-5 Executive Analysis
-        report += "🧠 GPT-5 EXECUTIVE ANALYSIS\n"
-        report += "=" * 100 + "\n\n"
-        report += gpt5_synthesis + "\n\n"
+        parts.append(f"🧠 GPT-5 EXECUTIVE ANALYSIS\n{divider}\n\n")
+        parts.append(gpt5_synthesis)
+        parts.append("\n\n")
         
         # Footer
-        report += "=" * 100 + "\n"
-        report += "🔬 Analysis Methodology: GPT-5 Responses API with High Reasoning Effort\n"
-        report += "📈 Data Integration: JSON Analytics + Markdown Narrative + HTML Reports\n"
-        report += "🎯 Target Audience: C-Level Executives and Strategic Decision Makers\n"
-        report += "⚡ Generated by SEFAS GPT-5 Independent Synthesis Agent\n"
-        report += "=" * 100 + "\n"
+        parts.append(
+            f"{divider}\n"
+            "🔬 Analysis Methodology: GPT-5 Responses API with High Reasoning Effort\n"
+            "📈 Data Integration: JSON Analytics + Markdown Narrative + HTML Reports\n"
+            "🎯 Target Audience: C-Level Executives and Strategic Decision Makers\n"
+            "⚡ Generated by SEFAS GPT-5 Independent Synthesis Agent\n"
+            f"{divider}\n"
+        )
         
-        return report
+        return "".join(parts)
     
-    def _save_executive_report(self, report_paths: Dict[str, str], executive_report: str, comprehensive_data: Dict[str, Any]) -> None:
-        """Save executive report to file"""
+    def _save_executive_report(self, report_paths: Dict[str, str], executive_report: str,
+                               comprehensive_data: Dict[str, Any], task_id: Optional[str] = None) -> Optional[Path]:
+        """Save executive report to file; returns its path, or None if it could not be written"""
         try:
-            # Create filename from task
-            task = comprehensive_data.get('json_data', {}).get('task', 'unknown_task')
-            task_name = re.sub(r'[^\w\s-]', '', task)
-            task_name = re.sub(r'\s+', '_', task_name).lower()[:50]
+            # Name the file after the task ID (given, or the run's execution_id), else after the task text
+            json_data = comprehensive_data.get('json_data', {})
+            execution_id = json_data.get('execution_id')
+            if task_id:
+                task_name = task_id
+            elif execution_id and execution_id != 'unknown':
+                task_name = execution_id
+            else:
+                task = json_data.get('task', 'unknown_task')
+                task_name = _NONWORD_RE.sub('', task)
+                task_name = _WS_RE.sub('_', task_name).lower()[:50]
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"gpt5_executive_report_{task_name}_{timestamp}.txt"
+            stem = f"gpt5_executive_report_{task_name}_{timestamp}"
             
             # Save to reports directory
             json_path = report_paths.get('json', '')
             if json_path:
                 reports_dir = Path(json_path).parent
             else:
-                reports_dir = Path("data/reports")
+                reports_dir = REPORTS_DIR
             
-            report_path = reports_dir / filename
+            # Never overwrite: a second report for the same name in the same second gets a suffix
+            report_path = reports_dir / f"{stem}.txt"
+            suffix = 2
+            while True:
+                try:
+                    with open(report_path, 'x', encoding='utf-8') as f:
+                        f.write(executive_report)
+                    break
+                except FileExistsError:
+                    report_path = reports_dir / f"{stem}_{suffix}.txt"
+                    suffix += 1
             
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(executive_report)
-            
-            print(f"💾 GPT-5 Executive Report saved to: {report_path}")
+            self.last_report_path = report_path
+            self._log(f"💾 GPT-5 Executive Report saved to: {report_path}")
             
         except Exception as e:
-            print(f"⚠️ Could not save executive report: {e}")
+            self.last_report_path = None
+            self._log(f"⚠️ Could not save executive report: {e}")
+        return self.last_report_path
+
 
+def _scan_json_reports(reports_dir: Path, name_filter: str = "") -> List[Tuple[Path, float]]:
+    """List JSON reports whose name contains name_filter, with their mtimes
+    
+    Uses os.scandir so the stat data comes from the directory read rather
+    than one extra stat() call per file.
+    """
+    try:
+        with os.scandir(reports_dir) as it:
+            return [
+                (Path(entry.path), entry.stat().st_mtime)
+                for entry in it
+                if entry.name.endswith('.json') and name_filter in entry.name and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
 
-def main():
+
+def _sibling_report_paths(json_path: str) -> Dict[str, str]:
+    """Collect the JSON report plus any HTML/Markdown reports written beside it"""
+    report_paths = {'json': json_path}
+    html_path = json_path.replace('.json', '.html')
+    md_path = json_path.replace('.json', '.md')
+    if Path(html_path).exists():
+        report_paths['html'] = html_path
+    if Path(md_path).exists():
+        report_paths['md'] = md_path
+    return report_paths
+
+
+async def synthesize(task_id: str, reports_dir: Path = REPORTS_DIR,
+                     agent: Optional["GPT5SynthesisAgent"] = None) -> Optional[Path]:
+    """Analyze the most recent reports for task_id in-process
+    
+    This is the programmatic form of `--auto <task_id>` for callers that already
+    run an event loop (e.g. scripts/run_experiment.py), avoiding a second
+    interpreter start-up. An already constructed agent can be passed in so its
+    set-up overlaps other work. Returns the saved executive report path, or
+    None if no report matched or the report could not be written.
+    """
+    json_entries = _scan_json_reports(reports_dir, task_id)
+    if not json_entries:
+        return None
+    
+    json_path = str(max(json_entries, key=lambda entry: entry[1])[0])
+    if agent is None:
+        agent = GPT5SynthesisAgent()
+    await agent.analyze_reports(_sibling_report_paths(json_path), preloaded_json=_load_json_file(json_path),
+                                task_id=task_id)
+    return agent.last_report_path
+
+
+def _create_agent_or_exit() -> GPT5SynthesisAgent:
+    """Build the agent for the command line, exiting if its dependencies are missing"""
+    try:
+        return GPT5SynthesisAgent()
+    except ImportError as e:
+        print(f"❌ {e}")
+        print("🔧 Ensure SEFAS environment is active and dependencies installed")
+        sys.exit(1)
+
+
+async def main():
     """Command line interface for GPT-5 synthesis agent"""
     parser = argparse.ArgumentParser(description="SEFAS GPT-5 Executive Synthesis Agent")
     parser.add_argument("--json", help="Path to JSON report")
     parser.add_argument("--html", help="Path to HTML report") 
     parser.add_argument("--md", help="Path to Markdown report")
     parser.add_argument("--auto", help="Auto-detect reports by task ID or filename pattern")
+    parser.add_argument("--all", action="store_true",
+                        help="With --auto, analyze every matching report in one batched GPT-5 request")
+    parser.add_argument("--separate", action="store_true",
+                        help="With --all, send one concurrent GPT-5 request per report instead of a batch")
     
     args = parser.parse_args()
     
     if args.auto:
         # Auto-detect report files
-        reports_dir = Path("data/reports")
+        reports_dir = REPORTS_DIR
         
-        # Try to find matching files by task ID
-        json_files = list(reports_dir.glob(f"*{args.auto}*.json"))
+        # Try to find matching files by task ID (stat each candidate once)
+        now = time.time()
+        json_entries = _scan_json_reports(reports_dir, args.auto)
         
-        if json_files:
+        if json_entries and args.all and len(json_entries) > 1:
+            # Analyze every match together, oldest first
+            print(f"📂 Found {len(json_entries)} matching reports. Analyzing all in one batch...")
+            batch_paths = [_sibling_report_paths(str(p)) for p, _ in sorted(json_entries, key=lambda entry: entry[1])]
+            
+            print("🚀 Initializing GPT-5 Executive Synthesis Agent...")
+            agent = _create_agent_or_exit()
+            if args.separate:
+                executive_reports = await agent.analyze_reports_concurrently(batch_paths)
+            else:
+                executive_reports = await agent.analyze_reports_batch(batch_paths)
+            for executive_report, report_path in executive_reports:
+                print("\n" + executive_report)
+                if report_path is not None:
+                    print(f"REPORT_PATH={report_path.resolve()}")
+            return
+        elif json_entries:
             # If multiple matches, use the most recent one
-            if len(json_files) > 1:
-                print(f"📂 Found {len(json_files)} matching reports. Using most recent...")
-                json_files = [max(json_files, key=lambda p: p.stat().st_mtime)]
+            if len(json_entries) > 1:
+                print(f"📂 Found {len(json_entries)} matching reports. Using most recent...")
+            json_file, json_mtime = max(json_entries, key=lambda entry: entry[1])
             
-            json_path = str(json_files[0])
+            json_path = str(json_file)
             
             # Verify the report is recent (within last hour to ensure it's from current run)
-            import time
-            file_age = time.time() - Path(json_path).stat().st_mtime
+            file_age = now - json_mtime
             if file_age > 3600:  # More than 1 hour old
                 print(f"⚠️ WARNING: Report is {file_age/60:.1f} minutes old - may not be from current run")
-                print(f"🕐 File: {Path(json_path).name}")
+                print(f"🕐 File: {json_file.name}")
             else:
                 print(f"✅ Report is recent ({file_age:.0f} seconds old) - analyzing current run")
             
-            html_path = json_path.replace('.json', '.html')
-            md_path = json_path.replace('.json', '.md')
-            
-            report_paths = {}
-            report_paths['json'] = json_path
-            if Path(html_path).exists():
-                report_paths['html'] = html_path
-            if Path(md_path).exists():
-                report_paths['md'] = md_path
+            report_paths = _sibling_report_paths(json_path)
                 
-            # Extract and display the actual task for verification
+            # Extract and display the actual task for verification; the parsed
+            # report is handed to the agent so it is not loaded twice
+            report_data = None
             try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    report_data = json.load(f)
+                report_data = _load_json_file(json_path)
                 actual_task = report_data.get('synthesis', {}).get('task', 'Unknown task')
                 print(f"📊 Analyzing reports for task ID {args.auto}: {list(report_paths.keys())}")
                 print(f"🎯 Task being analyzed: '{actual_task}'")
@@ -576,17 +966,18 @@ def main():
             print(f"❌ No reports found for task ID: {args.auto}")
             print(f"🔍 Searched for pattern: *{args.auto}*.json in {reports_dir}")
             # List recent files for debugging
-            recent_files = sorted(reports_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)[:3]
+            recent_files = sorted(_scan_json_reports(reports_dir), key=lambda entry: entry[1], reverse=True)[:3]
             if recent_files:
                 print(f"📋 Recent report files found:")
-                for f in recent_files:
-                    age_min = (time.time() - f.stat().st_mtime) / 60
+                for f, mtime in recent_files:
+                    age_min = (now - mtime) / 60
                     print(f"   • {f.name} ({age_min:.1f} min ago)")
             else:
                 print("📋 No report files found in directory")
             return
     else:
         # Manual file specification
+        report_data = None
         report_paths = {}
         if args.json and Path(args.json).exists():
             report_paths['json'] = args.json
@@ -601,13 +992,18 @@ def main():
     
     # Initialize GPT-5 agent and generate executive analysis
     print("🚀 Initializing GPT-5 Executive Synthesis Agent...")
-    agent = GPT5SynthesisAgent()
+    agent = _create_agent_or_exit()
     
     print("🎯 Beginning comprehensive executive analysis...")
-    executive_report = agent.analyze_reports(report_paths)
+    executive_report = await agent.analyze_reports(report_paths, preloaded_json=report_data)
     
     print("\n" + executive_report)
+    
+    # Machine-readable last line so callers running this script as a subprocess
+    # can pick up the report without scanning data/reports
+    if agent.last_report_path is not None:
+        print(f"REPORT_PATH={agent.last_report_path.resolve()}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
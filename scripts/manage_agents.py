@@ -3,26 +3,48 @@
 SEFAS Agent Management Interface
 
 Easy interface for viewing and modifying all 15 agent configurations.
+
+Set SEFAS_FAST_CLI=1 to dispatch through a plain argparse parser instead of
+building the Typer/Click command tree (same commands and arguments).
 """
 
+from __future__ import annotations
+
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Ensure repository root is on sys.path for absolute imports
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# Ensure repository root is on sys.path for absolute imports like `config.*`,
+# unless both top-level packages already import (installed or on PYTHONPATH),
+# which skips the resolve() filesystem walk
+try:
+    import config  # noqa: F401
+    import sefas  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
 from rich.text import Text
-from typing import Optional
 
-from sefas.agents.factory import AgentFactory
+# AgentFactory (via _get_factory) and the less common rich widgets are loaded
+# inside the commands that use them, so help and unrelated commands skip them.
 
 app = typer.Typer()
 console = Console()
+# Tables of plain config values need no markup parsing or auto-highlighting;
+# headers passed alongside them are pre-built Text objects.
+fast_console = Console(highlight=False, markup=False, emoji=False)
+
+
+@lru_cache(maxsize=1)
+def _get_factory():
+    """Return one AgentFactory per process so the YAML config is parsed once."""
+    from sefas.agents.factory import AgentFactory
+    return AgentFactory()
+
 
 @app.command()
 def list_agents(
@@ -30,35 +52,44 @@ def list_agents(
 ):
     """List all agents and their configurations"""
     
-    factory = AgentFactory()
-    agents_info = factory.list_agents()
+    factory = _get_factory()
+    agent_count = len(factory.config.get('agents', {}))
     
-    if not agents_info:
+    if not agent_count:
         console.print("❌ No agents found in configuration")
         return
     
-    console.print(f"🤖 [bold blue]SEFAS Agent Network ({len(agents_info)} agents)[/bold blue]")
+    header = Text.from_markup(f"🤖 [bold blue]SEFAS Agent Network ({agent_count} agents)[/bold blue]")
     
     if detail:
-        # Detailed view with full configuration
-        for agent_id, info in agents_info.items():
-            panel_content = Text()
-            panel_content.append(f"Role: ", style="cyan")
-            panel_content.append(f"{info['role']}\\n", style="white")
-            panel_content.append(f"Model: ", style="cyan")
-            panel_content.append(f"{info['model']}\\n", style="yellow")
-            panel_content.append(f"Temperature: ", style="cyan")
-            panel_content.append(f"{info['temperature']}\\n", style="green")
-            panel_content.append(f"Max Tokens: ", style="cyan")
-            panel_content.append(f"{info['max_tokens']}\\n", style="magenta")
-            panel_content.append(f"Strategy: ", style="cyan")
-            panel_content.append(f"{info['strategy']}", style="blue")
+        from rich.markup import escape
+        from rich.panel import Panel
+
+        # Detailed view with full configuration, rendered in a single pass
+        panels = []
+        for agent_id, info in factory.iter_agents():
+            panel_content = Text.from_markup(
+                f"[cyan]Role:[/cyan] [white]{escape(str(info['role']))}[/white]\n"
+                f"[cyan]Model:[/cyan] [yellow]{escape(str(info['model']))}[/yellow]\n"
+                f"[cyan]Temperature:[/cyan] [green]{info['temperature']}[/green]\n"
+                f"[cyan]Max Tokens:[/cyan] [magenta]{info['max_tokens']}[/magenta]\n"
+                f"[cyan]Strategy:[/cyan] [blue]{escape(str(info['strategy']))}[/blue]"
+            )
             
-            console.print(Panel(
+            panels.append(Panel(
                 panel_content,
                 title=f"[bold]{info['name']}[/bold] ({agent_id})",
                 border_style="green"
             ))
+        
+        # Each panel is ~7 rows tall; page the listing once it would scroll off-screen
+        if agent_count > max(1, console.size.height // 10):
+            pager = console.pager(styles=True)
+        else:
+            from contextlib import nullcontext
+            pager = nullcontext()
+        with pager:
+            console.print(Group(header, *panels))
     else:
         # Compact table view
         table = Table(title="Agent Network Overview", show_header=True)
@@ -69,23 +100,29 @@ def list_agents(
         table.add_column("Temp", style="magenta", width=6)
         table.add_column("Tokens", style="red", width=8)
         
-        for agent_id, info in agents_info.items():
-            table.add_row(
+        # Rows are built straight from the factory generator, no intermediate dict
+        rows = (
+            (
                 agent_id,
-                info['name'][:24] + "..." if len(info['name']) > 24 else info['name'],
+                info['name'] if len(info['name']) <= 24 else info['name'][:21] + "...",
                 info['role'],
                 info['model'],
                 f"{info['temperature']:.1f}",
-                str(info['max_tokens'])
+                str(info['max_tokens']),
             )
+            for agent_id, info in factory.iter_agents()
+        )
+        for row in rows:
+            table.add_row(*row)
         
-        console.print(table)
+        fast_console.print(Group(header, table))
 
 @app.command()
 def show(agent_id: str):
     """Show detailed configuration for a specific agent"""
+    from rich.panel import Panel
     
-    factory = AgentFactory()
+    factory = _get_factory()
     config = factory.get_agent_config(agent_id)
     
     if not config:
@@ -123,8 +160,10 @@ def show(agent_id: str):
 @app.command()
 def edit(agent_id: str):
     """Interactively edit an agent's configuration"""
+    from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
     
-    factory = AgentFactory()
+    factory = _get_factory()
     config = factory.get_agent_config(agent_id)
     
     if not config:
@@ -178,14 +217,8 @@ def edit(agent_id: str):
         
         console.print("\\n[cyan]Enter new prompt (press Ctrl+D when done):[/cyan]")
         try:
-            lines = []
-            while True:
-                try:
-                    line = input()
-                    lines.append(line)
-                except EOFError:
-                    break
-            new_prompt = '\\n'.join(lines)
+            # One read up to EOF instead of an input() call per line
+            new_prompt = sys.stdin.read().rstrip('\n')
             if new_prompt.strip():
                 updates['initial_prompt'] = new_prompt
         except KeyboardInterrupt:
@@ -208,11 +241,11 @@ def edit(agent_id: str):
 def clone(
     source: str = typer.Argument(..., help="Source agent ID to clone"),
     target: str = typer.Argument(..., help="New agent ID"),
-    name: Optional[str] = typer.Option(None, "--name", "-n", help="Name for the new agent")
+    name: str | None = typer.Option(None, "--name", "-n", help="Name for the new agent")
 ):
     """Clone an existing agent with optional modifications"""
     
-    factory = AgentFactory()
+    factory = _get_factory()
     
     modifications = {}
     if name:
@@ -229,16 +262,13 @@ def clone(
 def topology():
     """Show the agent network topology"""
     
-    factory = AgentFactory()
+    factory = _get_factory()
     topology = factory.get_topology()
     
     if not topology:
         console.print("❌ No topology configuration found")
         return
     
-    console.print("🕸️ [bold blue]Agent Network Topology[/bold blue]")
-    console.print("=" * 50)
-    
     table = Table(title="Agent Connections", show_header=True)
     table.add_column("Agent", style="cyan", width=20)
     table.add_column("Connections", style="yellow", width=40)
@@ -256,30 +286,29 @@ def topology():
         
         table.add_row(agent_id, connections_str, f"{weight:.1f}", priority)
     
-    console.print(table)
+    fast_console.print(Group(
+        Text.from_markup("🕸️ [bold blue]Agent Network Topology[/bold blue]"),
+        "=" * 50,
+        table,
+    ))
 
 @app.command()
 def models():
     """Show model distribution across agents"""
     
-    factory = AgentFactory()
-    agents_info = factory.list_agents()
-    
-    # Count models
-    model_counts = {}
-    temp_stats = {}
+    factory = _get_factory()
     
-    for agent_id, info in agents_info.items():
+    # Single pass: (count, temperature sum, min, max) per model
+    stats = {}
+    for _, info in factory.iter_agents():
         model = info['model']
         temp = info['temperature']
-        
-        model_counts[model] = model_counts.get(model, 0) + 1
-        
-        if model not in temp_stats:
-            temp_stats[model] = []
-        temp_stats[model].append(temp)
-    
-    console.print("🧠 [bold blue]Model Distribution[/bold blue]")
+        current = stats.get(model)
+        if current is None:
+            stats[model] = (1, temp, temp, temp)
+        else:
+            count, total, low, high = current
+            stats[model] = (count + 1, total + temp, min(low, temp), max(high, temp))
     
     table = Table(title="LLM Usage Across Agents", show_header=True)
     table.add_column("Model", style="cyan")
@@ -287,19 +316,22 @@ def models():
     table.add_column("Avg Temperature", style="green")
     table.add_column("Temp Range", style="magenta")
     
-    for model, count in sorted(model_counts.items()):
-        temps = temp_stats[model]
-        avg_temp = sum(temps) / len(temps)
-        temp_range = f"{min(temps):.1f} - {max(temps):.1f}"
+    for model, (count, total, low, high) in sorted(stats.items()):
+        avg_temp = total / count
+        temp_range = f"{low:.1f} - {high:.1f}"
         
         table.add_row(model, str(count), f"{avg_temp:.2f}", temp_range)
     
-    console.print(table)
+    fast_console.print(Group(Text.from_markup("🧠 [bold blue]Model Distribution[/bold blue]"), table))
 
 @app.command()
-def test(agent_id: Optional[str] = typer.Argument(None, help="Specific agent to test")):
+def test(agent_id: str | None = typer.Argument(None, help="Specific agent to test")):
     """Test agent creation and basic functionality"""
     
+    import yaml
+    if not yaml.__with_libyaml__:
+        console.print("⚠️ [yellow]PyYAML has no libyaml bindings; config loading uses the slower pure-Python parser[/yellow]")
+    
     if agent_id:
         # Test specific agent
         from sefas.agents.factory import quick_agent_test
@@ -312,10 +344,31 @@ def test(agent_id: Optional[str] = typer.Argument(None, help="Specific agent to
             console.print("❌ [red]Agent test failed![/red]")
     else:
         # Test all agents
-        factory = AgentFactory()
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from rich.progress import Progress
+        
+        factory = _get_factory()
         console.print("🧪 Testing all agents...")
         
-        agents = factory.create_all_agents()
+        # Agent construction builds LLM clients (I/O bound), so create them concurrently
+        agent_configs = factory.config.get('agents', {})
+        created = {}
+        with Progress(console=console, transient=True) as progress, ThreadPoolExecutor(max_workers=8) as pool:
+            task = progress.add_task("Creating agents", total=len(agent_configs))
+            futures = {
+                pool.submit(factory.create_agent, agent_id, agent_config): agent_id
+                for agent_id, agent_config in agent_configs.items()
+            }
+            for future in as_completed(futures):
+                agent_id = futures[future]
+                try:
+                    created[agent_id] = future.result()
+                except Exception as e:
+                    console.print(f"  ❌ Failed to create {agent_id}: {e}")
+                progress.advance(task)
+        
+        # Report in configuration order rather than completion order
+        agents = {agent_id: created[agent_id] for agent_id in agent_configs if agent_id in created}
         
         if len(agents) > 0:
             console.print(f"✅ [green]Successfully created {len(agents)} agents![/green]")
@@ -333,17 +386,28 @@ def test(agent_id: Optional[str] = typer.Argument(None, help="Specific agent to
                     agent.__class__.__name__
                 )
             
-            console.print(table)
+            fast_console.print(table)
         else:
             console.print("❌ [red]No agents could be created![/red]")
 
+@app.command()
+def refresh_cache():
+    """Re-parse the agent YAML and rebuild its JSON cache"""
+    
+    factory = _get_factory()
+    config = factory.refresh_cache()
+    factory.config = config
+    
+    console.print(f"✅ Rebuilt {factory.cache_path} ({len(config.get('agents', {}))} agents)")
+
 @app.command()
 def quick_config():
     """Quick configuration wizard for common agent modifications"""
+    from rich.prompt import Prompt
     
     console.print("⚡ [bold blue]Quick Agent Configuration Wizard[/bold blue]")
     
-    factory = AgentFactory()
+    factory = _get_factory()
     agents_info = factory.list_agents()
     
     # Show options
@@ -356,38 +420,33 @@ def quick_config():
     
     choice = Prompt.ask("Choose option", choices=["1", "2", "3", "4", "5"])
     
-    updates_applied = 0
+    # Collect every change first and write the config file once
+    pending = {}
     
     if choice == "1":
         # Switch to gpt-4o
-        for agent_id in agents_info.keys():
-            if factory.update_agent_config(agent_id, {"model": "gpt-4o"}):
-                updates_applied += 1
+        pending = {agent_id: {"model": "gpt-4o"} for agent_id in agents_info}
+        updates_applied = factory.bulk_update_agent_config(pending)
         console.print(f"✅ Switched {updates_applied} agents to gpt-4o")
         
     elif choice == "2":
         # Switch to gpt-4o-mini
-        for agent_id in agents_info.keys():
-            if factory.update_agent_config(agent_id, {"model": "gpt-4o-mini"}):
-                updates_applied += 1
+        pending = {agent_id: {"model": "gpt-4o-mini"} for agent_id in agents_info}
+        updates_applied = factory.bulk_update_agent_config(pending)
         console.print(f"✅ Switched {updates_applied} agents to gpt-4o-mini")
         
     elif choice == "3":
         # Increase creativity
         for agent_id, info in agents_info.items():
-            current_temp = info['temperature']
-            new_temp = min(0.8, current_temp + 0.2)
-            if factory.update_agent_config(agent_id, {"temperature": new_temp}):
-                updates_applied += 1
+            pending[agent_id] = {"temperature": min(0.8, info['temperature'] + 0.2)}
+        updates_applied = factory.bulk_update_agent_config(pending)
         console.print(f"✅ Increased creativity for {updates_applied} agents")
         
     elif choice == "4":
         # Increase focus
         for agent_id, info in agents_info.items():
-            current_temp = info['temperature']
-            new_temp = max(0.1, current_temp - 0.2)
-            if factory.update_agent_config(agent_id, {"temperature": new_temp}):
-                updates_applied += 1
+            pending[agent_id] = {"temperature": max(0.1, info['temperature'] - 0.2)}
+        updates_applied = factory.bulk_update_agent_config(pending)
         console.print(f"✅ Increased focus for {updates_applied} agents")
         
     elif choice == "5":
@@ -399,20 +458,68 @@ def quick_config():
         
         assignments = Prompt.ask("Enter assignments (comma-separated)")
         
-        for assignment in assignments.split(','):
-            if '=' not in assignment:
-                continue
-            agent_id, model = assignment.strip().split('=', 1)
-            if agent_id in agents_info:
-                if factory.update_agent_config(agent_id, {"model": model.strip()}):
-                    updates_applied += 1
-                    console.print(f"  ✅ {agent_id} → {model.strip()}")
-                else:
-                    console.print(f"  ❌ Failed to update {agent_id}")
-            else:
-                console.print(f"  ⚠️ Agent {agent_id} not found")
+        # Per-agent feedback, but only one YAML write when the block exits
+        updates_applied = 0
+        try:
+            with factory.transaction():
+                for assignment in assignments.split(','):
+                    if '=' not in assignment:
+                        continue
+                    agent_id, model = assignment.strip().split('=', 1)
+                    if agent_id in agents_info:
+                        if factory.update_agent_config(agent_id, {"model": model.strip()}):
+                            updates_applied += 1
+                            console.print(f"  ✅ {agent_id} → {model.strip()}")
+                        else:
+                            console.print(f"  ❌ Failed to update {agent_id}")
+                    else:
+                        console.print(f"  ⚠️ Agent {agent_id} not found")
+        except OSError as e:
+            console.print(f"  ❌ Failed to save configuration: {e}")
+            updates_applied = 0
         
         console.print(f"\\n✅ Applied {updates_applied} custom assignments")
 
+def _run_fast_cli(argv) -> None:
+    """Parse argv with argparse and call the matching command directly"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="manage_agents.py", description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    
+    p = sub.add_parser("list-agents", aliases=["list"], help="List all agents and their configurations")
+    p.add_argument("--detail", "-d", action="store_true", help="Show detailed information")
+    p.set_defaults(handler=list_agents)
+    
+    for name, handler in (("show", show), ("edit", edit)):
+        p = sub.add_parser(name, help=handler.__doc__)
+        p.add_argument("agent_id")
+        p.set_defaults(handler=handler)
+    
+    p = sub.add_parser("clone", help=clone.__doc__)
+    p.add_argument("source", help="Source agent ID to clone")
+    p.add_argument("target", help="New agent ID")
+    p.add_argument("--name", "-n", default=None, help="Name for the new agent")
+    p.set_defaults(handler=clone)
+    
+    p = sub.add_parser("test", help=test.__doc__)
+    p.add_argument("agent_id", nargs="?", default=None, help="Specific agent to test")
+    p.set_defaults(handler=test)
+    
+    for name, handler in (
+        ("topology", topology),
+        ("models", models),
+        ("refresh-cache", refresh_cache),
+        ("quick-config", quick_config),
+    ):
+        sub.add_parser(name, help=handler.__doc__).set_defaults(handler=handler)
+    
+    args = vars(parser.parse_args(argv))
+    args.pop("command")
+    args.pop("handler")(**args)
+
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    if os.environ.get("SEFAS_FAST_CLI") == "1":
+        _run_fast_cli(sys.argv[1:])
+    else:
+        app()
\ No newline at end of file
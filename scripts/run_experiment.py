@@ -3,67 +3,215 @@
 Main CLI for running SEFAS experiments
 """
 
+from __future__ import annotations
+
 import sys
 from pathlib import Path
-from sefas.core.belief_propagation import BeliefPropagationEngine
-from sefas.core.validation import ValidatorPool
-from sefas.core.redundancy import RedundancyOrchestrator
 
+# Top-level help, kept in sync with the commands below. Printed before typer
+# and rich are imported so `run_experiment.py --help` returns immediately;
+# per-command help (`run --help`) still goes through Typer.
+_STATIC_HELP = """\
+Usage: run_experiment.py [OPTIONS] COMMAND [ARGS]...
+
+  Main CLI for running SEFAS experiments. A bare task string runs `run`:
+  run_experiment.py "Summarize the benefits of renewable energy"
+
+Options:
+  -h, --help  Show this message and exit.
+
+Commands:
+  run      Run a single task through the SEFAS system
+  batch    Run batch experiments from a file
+  analyze  Analyze experiment results
+"""
+
+# Allow calling as: `python scripts/run_experiment.py "task..."` (insert default command).
+# Only when run directly; scripts/sefas_cli.py imports this module as a sub-app.
+KNOWN_COMMANDS = {"run", "batch", "analyze", "--help", "-h"}
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] not in KNOWN_COMMANDS:
+        sys.argv.insert(1, "run")
+    if sys.argv[1:2] in (["--help"], ["-h"]):
+        sys.stdout.write(_STATIC_HELP)
+        sys.exit(0)
 
-# Ensure repository root is on sys.path for absolute imports like `config.*`
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# Ensure repository root is on sys.path for absolute imports like `config.*`,
+# unless both top-level packages already import (installed or on PYTHONPATH),
+# which skips the resolve() filesystem walk
+try:
+    import config  # noqa: F401
+    import sefas  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import typer
 import asyncio
-import webbrowser
-from pathlib import Path
-from rich.console import Console
+from itertools import islice
+from rich.console import Console, Group
+from rich.panel import Panel
 from rich.table import Table
-from typing import Optional
 
-from sefas.workflows.executor import FederatedSystemRunner
-from sefas.monitoring.execution_reporter import execution_reporter
-from sefas.reporting.report_synthesizer import ReportSynthesizer
+# Optional faster event loop, passed only to the loops this script creates
+try:
+    import uvloop
+    _loop_factory = uvloop.new_event_loop
+except ImportError:  # not installed (or unsupported platform): default loop
+    _loop_factory = None
 
-# Allow calling as: `python scripts/run_experiment.py "task..."` (insert default command)
-KNOWN_COMMANDS = {"run", "batch", "analyze", "--help", "-h"}
-if len(sys.argv) >= 2 and sys.argv[1] not in KNOWN_COMMANDS:
-    sys.argv.insert(1, "run")
+try:
+    import orjson
+
+    _load_json = orjson.loads
+
+    def _dump_json(data) -> bytes:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+except ImportError:  # orjson is an optional speedup
+    import json
+
+    _load_json = json.loads
+
+    def _dump_json(data) -> bytes:
+        return json.dumps(data, indent=2, default=str).encode()
+
+# SEFAS modules pull in LLM clients and monitoring; they are imported inside
+# the command handlers so `--help` and unrelated subcommands stay fast.
 
 app = typer.Typer()
 console = Console()
 
+if hasattr(asyncio, "Runner"):
+    _LoopRunner = asyncio.Runner
+else:
+    class _LoopRunner:
+        """Minimal asyncio.Runner stand-in for Python < 3.11: one loop, many run() calls"""
+
+        def __init__(self, *, loop_factory=None):
+            self._loop_factory = loop_factory or asyncio.new_event_loop
+
+        def __enter__(self):
+            self._loop = self._loop_factory()
+            asyncio.set_event_loop(self._loop)
+            return self
+
+        def run(self, coro):
+            return self._loop.run_until_complete(coro)
+
+        def __exit__(self, *exc_info):
+            try:
+                self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+                self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            finally:
+                asyncio.set_event_loop(None)
+                self._loop.close()
+
+
+def _trunc(text: str, limit: int) -> str:
+    """Shorten text to limit characters plus an ellipsis for table cells"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _load_synthesis_agent():
+    """Import the GPT-5 synthesis module and build its agent (blocking; run in a thread)"""
+    import gpt5_synthesis_agent
+    return gpt5_synthesis_agent, gpt5_synthesis_agent.GPT5SynthesisAgent()
+
+
+async def _run_and_start_synthesis(runner, task: str):
+    """Run the task, then hand its GPT-5 executive synthesis to a background task.
+    
+    Synthesis reads the reports the runner writes at the very end, so it cannot
+    start earlier; its set-up (OpenAI SDK import and client construction)
+    overlaps the run in a worker thread. Returns (result, synthesis_task), where
+    synthesis_task resolves to the report path, or is None when the result has
+    nothing to synthesize. The caller renders the SEFAS report first and awaits
+    the task on the same loop only when the GPT-5 panel is next.
+    """
+    agent_setup = asyncio.create_task(asyncio.to_thread(_load_synthesis_agent))
+    result = await runner.run(task)
+    
+    task_id = result.get('task_id')
+    if not (result.get('synthesis') and result.get('reports') and task_id):
+        # Not needed for this result; let the set-up thread finish quietly
+        await asyncio.gather(agent_setup, return_exceptions=True)
+        return result, None
+    
+    async def synthesize():
+        module, agent = await agent_setup
+        return await module.synthesize(task_id, agent=agent)
+    
+    return result, asyncio.create_task(synthesize())
+
+
+async def _wait_for(task: asyncio.Task):
+    """Await a task from a later Runner.run() call, which only accepts coroutines"""
+    return await task
+
+
+async def _run_batch(make_runner, tasks, concurrency: int):
+    """Run every task on its own runner, at most `concurrency` at a time.
+    
+    A runner keeps one belief engine and agent history for everything it runs,
+    so concurrent tasks each get a fresh one from make_runner. Results come back
+    in task order; a task that raises is returned as the exception so one
+    failure does not cancel the rest of the batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run_one(task: str):
+        async with semaphore:
+            return await make_runner().run(task)
+    
+    return await asyncio.gather(*(run_one(task) for task in tasks), return_exceptions=True)
+
 @app.command()
 def run(
     task: str = typer.Argument("Demo task: summarize the benefits of renewable energy.", help="Task to execute"),
     max_hops: int = typer.Option(10, help="Maximum hops allowed"),
-    experiment_name: Optional[str] = typer.Option(None, help="Experiment name for tracking"),
+    experiment_name: str | None = typer.Option(None, help="Experiment name for tracking"),
     verbose: bool = typer.Option(False, help="Verbose output")
 ):
     """Run a single task through the SEFAS system"""
-    
     console.print(f"[bold green]Starting SEFAS experiment[/bold green]")
     console.print(f"Task: {task}")
+
+    from sefas.workflows.executor import FederatedSystemRunner
     
     # Initialize runner
     runner = FederatedSystemRunner(max_hops=max_hops)
     
-    # Run task
-    result = asyncio.run(runner.run(task))
+    # Task, report and GPT-5 synthesis share one event loop, which stays open
+    # while the report renders so the synthesis task can be awaited afterwards
+    with _LoopRunner(loop_factory=_loop_factory) as loop_runner:
+        result, synthesis_task = loop_runner.run(_run_and_start_synthesis(runner, task))
+        _display_run(loop_runner, runner, task, result, synthesis_task, verbose)
+
+
+def _display_run(loop_runner, runner, task: str, result, synthesis_task, verbose: bool):
+    """Render the results of `run`, awaiting GPT-5 synthesis just before its panel"""
+    # Pulls in markdown-it, so only imported by the command that renders reports
+    from rich.markdown import Markdown
     
     # Display comprehensive synthesis report
     if 'synthesis' in result and result['synthesis']:
         synthesis = result['synthesis']
-        console.print("\n[bold blue]📊 SEFAS Comprehensive Analysis Report[/bold blue]")
-        console.print("=" * 60)
+        # Collected and printed once as a Group below
+        renderables = [
+            "\n[bold blue]📊 SEFAS Comprehensive Analysis Report[/bold blue]",
+            "=" * 60,
+        ]
         
         # Executive Summary
-        console.print("\n[bold]📋 Executive Summary:[/bold]")
+        renderables.append("\n[bold]📋 Executive Summary:[/bold]")
         exec_summary = synthesis.get('executive_summary', 'No summary available')
-        console.print(f"[italic]{exec_summary}[/italic]")
+        renderables.append(f"[italic]{exec_summary}[/italic]")
         
         # Key Metrics
-        console.print("\n[bold]🎯 Key Performance Metrics:[/bold]")
+        renderables.append("\n[bold]🎯 Key Performance Metrics:[/bold]")
         metrics_table = Table(title="System Performance")
         metrics_table.add_column("Metric", style="cyan")
         metrics_table.add_column("Value", style="magenta")
@@ -73,26 +221,27 @@ def run(
         proposals = synthesis.get('proposals', {})
         verification = synthesis.get('verification', {})
         evolution = synthesis.get('evolution', {})
+        # Values read by several sections below, looked up once
+        recommendations = synthesis.get('recommendations', [])
+        mean_confidence = consensus.get('mean_confidence', 0.0)
+        consensus_reached = consensus.get('consensus_reached', False)
+        agent_contributions = synthesis.get('agent_contributions', {})
+        critical_issues = verification.get('critical_issues', [])
         
         metrics_table.add_row("Task ID", result['task_id'])
-        metrics_table.add_row("Consensus Reached", "✅ Yes" if consensus.get('consensus_reached', False) else "❌ No")
-        metrics_table.add_row("Mean Confidence", f"{consensus.get('mean_confidence', 0.0):.2%}")
+        metrics_table.add_row("Consensus Reached", "✅ Yes" if consensus_reached else "❌ No")
+        metrics_table.add_row("Mean Confidence", f"{mean_confidence:.2%}")
         metrics_table.add_row("Total Proposals", str(proposals.get('total_proposals', 0)))
         metrics_table.add_row("Agents Evolved", str(len(evolution.get('evolved_agents', []))))
         metrics_table.add_row("Execution Time", f"{performance.get('total_execution_time', 0.0):.2f}s")
         metrics_table.add_row("Total Tokens", f"{performance.get('total_tokens_used', 0):,}")
         metrics_table.add_row("Estimated Cost", f"${performance.get('estimated_cost_usd', 0.0):.4f}")
         
-        console.print(metrics_table)
+        renderables.append(metrics_table)
         
         # Direct User-Friendly Answer Display - Using Available Synthesis Data
-        from rich.panel import Panel
-        
         # Get data that's already available in synthesis
         executive_summary = synthesis.get('executive_summary', 'Analysis completed successfully.')
-        recommendations = synthesis.get('recommendations', [])
-        mean_confidence = consensus.get('mean_confidence', 0.0)
-        consensus_reached = consensus.get('consensus_reached', False)
         
         # Style the confidence level
         if mean_confidence > 0.8:
@@ -128,7 +277,7 @@ def run(
 
 ✅ **Consensus Status:** {'Reached - High agreement among agents' if consensus_reached else 'Partial - Agents still analyzing'}
 
-🤖 **Agent Network:** {len(synthesis.get('agent_contributions', {}))} specialized agents analyzed this request"""
+🤖 **Agent Network:** {len(agent_contributions)} specialized agents analyzed this request"""
         
         # Create prominent answer panel
         answer_panel = Panel(
@@ -140,14 +289,13 @@ def run(
             expand=False
         )
         
-        console.print("\n")
-        console.print(answer_panel)
-        console.print("\n")
+        renderables.append("\n")
+        renderables.append(answer_panel)
+        renderables.append("\n")
         
         # Agent Contributions
-        agent_contributions = synthesis.get('agent_contributions', {})
         if agent_contributions:
-            console.print("\n[bold]🤖 Agent Contributions:[/bold]")
+            renderables.append("\n[bold]🤖 Agent Contributions:[/bold]")
             agent_table = Table(title="Individual Agent Performance")
             agent_table.add_column("Agent", style="cyan")
             agent_table.add_column("Role", style="yellow")
@@ -156,139 +304,86 @@ def run(
             agent_table.add_column("Tokens", style="magenta")
             agent_table.add_column("Fitness", style="red")
             
-            for agent_id, contrib in list(agent_contributions.items())[:8]:  # Limit to 8 agents for display
-                agent_table.add_row(
-                    agent_id[:15] + "..." if len(agent_id) > 15 else agent_id,
-                    contrib['role'][:12] + "..." if len(contrib['role']) > 12 else contrib['role'],
+            rows = [
+                (
+                    _trunc(agent_id, 15),
+                    _trunc(contrib['role'], 12),
                     f"{contrib['confidence']:.1%}",
                     f"{contrib['execution_time']:.2f}",
                     str(contrib['tokens_used']),
-                    f"{contrib['fitness_score']:.1%}"
+                    f"{contrib['fitness_score']:.1%}",
                 )
+                for agent_id, contrib in islice(agent_contributions.items(), 8)  # Limit to 8 agents for display
+            ]
+            for row in rows:
+                agent_table.add_row(*row)
             
-            console.print(agent_table)
+            renderables.append(agent_table)
         
         # Top Recommendations
-        recommendations = synthesis.get('recommendations', [])
         if recommendations:
-            console.print("\n[bold]💡 Top Recommendations:[/bold]")
+            renderables.append("\n[bold]💡 Top Recommendations:[/bold]")
             for i, rec in enumerate(recommendations[:5], 1):
                 source = rec.get('source', 'Unknown')
                 confidence = rec.get('confidence', 0.0)
                 recommendation = rec.get('recommendation', '')
-                console.print(f"  {i}. [bold]{source}[/bold] ({confidence:.1%}): {recommendation}")
+                renderables.append(f"  {i}. [bold]{source}[/bold] ({confidence:.1%}): {recommendation}")
         
         # Critical Issues
-        critical_issues = verification.get('critical_issues', [])
         if critical_issues:
-            console.print("\n[bold red]⚠️ Critical Issues Identified:[/bold red]")
+            renderables.append("\n[bold red]⚠️ Critical Issues Identified:[/bold red]")
             for issue in critical_issues[:3]:  # Show top 3 critical issues
                 checker = issue.get('checker', 'Unknown')
                 issue_text = issue.get('issue', '')
-                console.print(f"  • [bold]{checker}[/bold]: {issue_text}")
+                renderables.append(f"  • [bold]{checker}[/bold]: {issue_text}")
         
         # Report Files
         if 'reports' in result and result['reports']:
-            console.print("\n[bold]📄 Generated Reports:[/bold]")
+            renderables.append("\n[bold]📄 Generated Reports:[/bold]")
             for format_type, filepath in result['reports'].items():
-                console.print(f"  • {format_type.upper()}: {filepath}")
-            
-            # Generate GPT-5 executive synthesis (independent of core system)
+                renderables.append(f"  • {format_type.upper()}: {filepath}")
+        
+        # Everything above goes out in a single layout pass and write
+        console.print(Group(*renderables))
+        
+        if 'reports' in result and result['reports']:
+            # GPT-5 executive synthesis (independent of core system)
             try:
-                console.print("\n[bold]🧠 Generating GPT-5 Executive Synthesis...[/bold]")
-                
-                # Import and run independent GPT-5 synthesis agent
-                import subprocess
-                import sys
+                console.print("\n[bold]🧠 GPT-5 Executive Synthesis[/bold]")
                 
                 # Get the actual task ID from current run (not from filename)
                 task_id = result.get('task_id')
                 if task_id:
-                        # Run independent GPT-5 synthesis agent
-                        synthesis_cmd = [
-                            sys.executable, 
-                            "scripts/gpt5_synthesis_agent.py", 
-                            "--auto", 
-                            task_id
-                        ]
-                        
-                        # Execute synthesis in subprocess to avoid module conflicts
-                        result_synthesis = subprocess.run(
-                            synthesis_cmd, 
-                            capture_output=True, 
-                            text=True, 
-                            cwd=str(Path.cwd())  # Convert Path to string
-                        )
+                    # Started when the run finished; only waited for now that its panel is next.
+                    # The agent's status lines print above the spinner as they are flushed
+                    with console.status("[bold]🧠 GPT-5 executive synthesis in progress...[/bold]"):
+                        report_path = loop_runner.run(_wait_for(synthesis_task))
+                    
+                    if report_path is not None:
+                        console.print("✅ [green]GPT-5 Executive Synthesis completed successfully[/green]")
+                        console.print(f"📋 [cyan]Analyzed current experiment: {task_id}[/cyan]")
                         
-                        if result_synthesis.returncode == 0:
-                            console.print("✅ [green]GPT-5 Executive Synthesis completed successfully[/green]")
-                            console.print(f"📋 [cyan]Analyzed current experiment: {task_id}[/cyan]")
+                        # Also display the GPT-5 analysis in Rich UI
+                        try:
+                            gpt5_content = report_path.read_text(encoding='utf-8')
+                            
+                            # Create Rich Panel with GPT-5 content
+                            gpt5_panel = Panel(
+                                Markdown(gpt5_content),
+                                title="[bold green]🧠 GPT-5 EXECUTIVE ANALYSIS[/bold green]",
+                                subtitle="[bold cyan]Independent Executive Assessment[/bold cyan]",
+                                border_style="green",
+                                padding=(1, 2),
+                                expand=True
+                            )
                             
-                            # Also display the GPT-5 analysis in Rich UI
-                            try:
-                                # Subprocess.run() is synchronous, so GPT-5 has completed, but give filesystem a moment to flush
-                                import time
-                                
-                                reports_dir = Path("data/reports")
-                                start_time = time.time()
-                                recent_gpt5_files = []
-                                
-                                # Poll for the file for up to 5 seconds (should be immediate, but be safe)
-                                for attempt in range(10):  # 10 attempts over 5 seconds
-                                    current_time = time.time()
-                                    
-                                    # Find GPT-5 files created in the last 60 seconds (should be from this run)
-                                    recent_gpt5_files = [
-                                        f for f in reports_dir.glob("gpt5_executive_report_*.txt")
-                                        if (current_time - f.stat().st_mtime) < 60  # Extended to 60 seconds for safety
-                                    ]
-                                    
-                                    if recent_gpt5_files:
-                                        break
-                                    
-                                    time.sleep(0.5)  # Wait 0.5 seconds between attempts
-                                
-                                if recent_gpt5_files:
-                                    # Get the most recent one from this run
-                                    latest_file = max(recent_gpt5_files, key=lambda f: f.stat().st_mtime)
-                                    console.print(f"📄 [green]Found current run report: {latest_file.name}[/green]")
-                                    
-                                    # Read and display the GPT-5 analysis
-                                    gpt5_content = latest_file.read_text(encoding='utf-8')
-                                    
-                                    # Create Rich Panel with GPT-5 content
-                                    from rich.panel import Panel
-                                    from rich.markdown import Markdown
-                                    
-                                    gpt5_panel = Panel(
-                                        Markdown(gpt5_content),
-                                        title="[bold green]🧠 GPT-5 EXECUTIVE ANALYSIS[/bold green]",
-                                        subtitle="[bold cyan]Independent Executive Assessment[/bold cyan]",
-                                        border_style="green",
-                                        padding=(1, 2),
-                                        expand=True
-                                    )
-                                    
-                                    console.print("\n")
-                                    console.print(gpt5_panel)
-                                    console.print("\n")
-                                else:
-                                    # Check if any GPT-5 files exist at all
-                                    all_gpt5_files = list(reports_dir.glob("gpt5_executive_report_*.txt"))
-                                    if all_gpt5_files:
-                                        latest_any = max(all_gpt5_files, key=lambda f: f.stat().st_mtime)
-                                        age_seconds = current_time - latest_any.stat().st_mtime
-                                        console.print(f"⚠️ [yellow]No recent GPT-5 report found after polling for 5 seconds[/yellow]")
-                                        console.print(f"📝 [dim]Latest report is {age_seconds:.1f} seconds old: {latest_any.name}[/dim]")
-                                        console.print(f"🔍 [dim]Checked {len(all_gpt5_files)} existing files[/dim]")
-                                    else:
-                                        console.print("⚠️ [yellow]No GPT-5 reports found in reports directory[/yellow]")
-                            except Exception as e:
-                                console.print(f"⚠️ [yellow]Could not display GPT-5 analysis: {e}[/yellow]")
-                        else:
-                            console.print(f"⚠️ [yellow]GPT-5 synthesis failed: {result_synthesis.stderr[:200]}[/yellow]")
-                            if result_synthesis.stdout:
-                                console.print(f"📝 Output: {result_synthesis.stdout[:300]}")
+                            console.print("\n")
+                            console.print(gpt5_panel)
+                            console.print("\n")
+                        except Exception as e:
+                            console.print(f"⚠️ [yellow]Could not display GPT-5 analysis: {e}[/yellow]")
+                    else:
+                        console.print(f"⚠️ [yellow]GPT-5 synthesis produced no report for task {task_id}[/yellow]")
                 else:
                     console.print("⚠️ [yellow]No task ID available for synthesis[/yellow]")
                     
@@ -297,17 +392,22 @@ def run(
             
             # Auto-open HTML report in browser if available
             if 'html' in result['reports'] and not verbose:
-                html_path = result['reports']['html']
+                import webbrowser
+                
+                # as_uri() also gets Windows drive letters and escaping right
+                html_uri = Path(result['reports']['html']).resolve().as_uri()
                 try:
-                    webbrowser.open(f"file://{Path(html_path).absolute()}")
+                    webbrowser.open(html_uri)
                     console.print(f"\n🌐 [bold green]HTML report opened in browser![/bold green]")
                 except Exception:
-                    console.print(f"\n💻 [yellow]Manual open: file://{Path(html_path).absolute()}[/yellow]")
+                    console.print(f"\n💻 [yellow]Manual open: {html_uri}[/yellow]")
     
     # Fallback to original execution reporter if synthesis not available
     else:
         console.print("\n[bold yellow]📊 Generating Enhanced Execution Report...[/bold yellow]")
         
+        from sefas.monitoring.execution_reporter import execution_reporter
+        
         # Display comprehensive report
         execution_reporter.display_execution_report(result)
         
@@ -319,18 +419,18 @@ def run(
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="magenta")
         
-        table.add_row("Task ID", result['task_id'])
-        table.add_row("Hops Taken", str(result['current_hop']))
+        # Pull everything the table needs out of result once
+        confidence_scores = result.get('confidence_scores') or {}
+        proposals = result.get('proposals') or ()
+        verifications = result.get('verifications') or ()
         # Handle empty confidence scores gracefully
-        confidence_scores = result.get('confidence_scores', {})
-        if confidence_scores:
-            max_confidence = max(confidence_scores.values())
-        else:
-            max_confidence = 0.0
+        max_confidence = max(confidence_scores.values()) if confidence_scores else 0.0
         
+        table.add_row("Task ID", result['task_id'])
+        table.add_row("Hops Taken", str(result['current_hop']))
         table.add_row("Final Confidence", f"{max_confidence:.2%}")
         table.add_row("Consensus Reached", "✅" if result['consensus'] else "❌")
-        table.add_row("Total API Calls", str(len(result.get('proposals', [])) + len(result.get('verifications', []))))
+        table.add_row("Total API Calls", str(len(proposals) + len(verifications)))
         table.add_row("Execution Time", f"{result.get('execution_time', 0):.2f}s")
         table.add_row("Total Tokens", str(result.get('tokens_used', 0)))
         
@@ -353,11 +453,46 @@ def run(
 @app.command()
 def batch(
     tasks_file: Path = typer.Argument(..., help="JSON file with tasks"),
-    output_dir: Path = typer.Option(Path("results"), help="Output directory")
+    output_dir: Path = typer.Option(Path("results"), help="Output directory"),
+    max_hops: int = typer.Option(10, help="Maximum hops allowed"),
+    concurrency: int = typer.Option(8, min=1, help="Tasks run at the same time (bounds LLM request load)")
 ):
     """Run batch experiments from a file"""
-    # Implementation for batch processing
-    pass
+    # A JSON list of task strings, or of objects with a "task" key
+    tasks = [t if isinstance(t, str) else t['task'] for t in _load_json(tasks_file.read_bytes())]
+    if not tasks:
+        console.print(f"[yellow]No tasks found in {tasks_file}[/yellow]")
+        return
+    
+    console.print(f"[bold green]Starting SEFAS batch[/bold green]: {len(tasks)} tasks, up to {concurrency} at a time")
+    
+    from sefas.workflows.executor import FederatedSystemRunner
+    
+    # One event loop for the whole batch, one runner per task
+    with _LoopRunner(loop_factory=_loop_factory) as loop_runner:
+        results = loop_runner.run(
+            _run_batch(lambda: FederatedSystemRunner(max_hops=max_hops), tasks, concurrency)
+        )
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summary = Table(title="Batch Results")
+    summary.add_column("#", style="cyan")
+    summary.add_column("Task")
+    summary.add_column("Result", style="magenta")
+    failures = 0
+    for index, (task, result) in enumerate(zip(tasks, results), 1):
+        if isinstance(result, BaseException):
+            result = {'task': task, 'error': str(result), 'error_type': type(result).__name__}
+        out_path = output_dir / f"{result.get('task_id') or f'task_{index:03d}'}.json"
+        out_path.write_bytes(_dump_json(result))
+        if 'error' in result:
+            failures += 1
+            status = f"❌ {result.get('error_type', 'Error')}: {result['error']}"[:80]
+        else:
+            status = "✅ consensus" if result.get('consensus') else "⚠️ no consensus"
+        summary.add_row(str(index), task[:60] + ("..." if len(task) > 60 else ""), status)
+    
+    console.print(Group(summary, f"\n[dim]{len(tasks) - failures}/{len(tasks)} tasks completed; results written to {output_dir}[/dim]"))
 
 @app.command()
 def analyze(
@@ -4,6 +4,11 @@ Enhanced SEFAS runner with comprehensive reporting demonstration
 """
 
 import sys
+import json
+import hashlib
+import argparse
+import contextlib
+from itertools import islice
 from pathlib import Path
 
 # Ensure repository root is on sys.path for absolute imports
@@ -11,7 +16,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import asyncio
 import webbrowser
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
@@ -20,8 +25,131 @@ from sefas.workflows.executor import FederatedSystemRunner
 
 console = Console()
 
-async def run_with_comprehensive_reports(task: str = None):
-    """Run SEFAS with comprehensive reporting demonstration"""
+FORMAT_DESCRIPTIONS = {
+    'markdown': 'Detailed technical report with full analysis',
+    'html': 'Interactive web report with styling and navigation',
+    'json': 'Structured data for programmatic analysis'
+}
+
+# Agent status ladder: the first row whose confidence and fitness floors are
+# both exceeded wins; anything below every row needs review
+_AGENT_STATUS = (
+    (0.8, 0.7, "🌟 Excellent"),
+    (0.6, 0.5, "✅ Good"),
+    (0.4, float('-inf'), "🟡 Fair"),
+)
+_AGENT_STATUS_DEFAULT = "🔴 Needs Review"
+
+# (exclusive lower bound, label) ladders, highest first
+_CONFIDENCE_QUALITY = ((0.8, "🟢 High"), (0.5, "🟡 Med"))
+_PROPOSAL_QUALITY = ((5, "🟢 Good"), (2, "🟡 Fair"))
+_RECOMMENDATION_STYLE = ((0.8, "green"), (0.6, "yellow"))
+
+def _ladder_label(value, ladder, default):
+    """Label of the first ladder step whose bound value exceeds"""
+    return next((label for bound, label in ladder if value > bound), default)
+
+# Opt-in (--cache) store of finished results, so a repeat demo can skip the agents
+RESULT_CACHE_DIR = Path(".sefas_cache")
+AGENTS_CONFIG = Path("config/agents.yaml")
+
+# The only result fields the report below reads; everything cached must be plain JSON
+_CACHED_RESULT_KEYS = ('task_id', 'synthesis', 'reports')
+
+def _result_cache_path(task: str) -> Path:
+    """Cache entry for task under the current agent config, model and hop limit"""
+    from config.settings import get_settings
+    settings = get_settings()
+    digest = hashlib.sha256(task.encode('utf-8'))
+    try:
+        digest.update(AGENTS_CONFIG.read_bytes())
+    except OSError:
+        pass  # the runner falls back to its built-in agent config
+    digest.update(f"{settings.llm_model}|{settings.max_hops}".encode('utf-8'))
+    return RESULT_CACHE_DIR / f"{digest.hexdigest()}.json"
+
+def _load_cached_result(path: Path):
+    """Return the cached result dict, or None if there is no usable entry.
+    
+    An entry whose report files have since been removed counts as a miss.
+    """
+    try:
+        result = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    reports = result.get('reports') or {}
+    if not all(Path(filepath).exists() for filepath in reports.values()):
+        return None
+    return result
+
+def _store_cached_result(path: Path, result) -> None:
+    """Best-effort cache write; a result that is not plain JSON is not cached"""
+    try:
+        payload = json.dumps({key: result.get(key) for key in _CACHED_RESULT_KEYS})
+    except (TypeError, ValueError):
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(payload, encoding='utf-8')
+    except OSError:
+        pass
+
+def _describe_report_file(filepath):
+    """(file name, size in bytes) for a generated report; size is 0 if it is missing"""
+    path = Path(filepath)
+    try:
+        return path.name, path.stat().st_size
+    except OSError:
+        return path.name, 0
+
+def _build_result_tables():
+    """Empty metrics, agent and report tables; the report adds their rows"""
+    metrics_table = Table(title="Multi-Agent System Analysis", show_header=True)
+    metrics_table.add_column("Category", style="cyan", width=20)
+    metrics_table.add_column("Metric", style="yellow", width=25)
+    metrics_table.add_column("Value", style="magenta", width=15)
+    metrics_table.add_column("Quality", style="green", width=10)
+    
+    agent_table = Table(title="Agent Performance Breakdown")
+    agent_table.add_column("Agent ID", style="cyan")
+    agent_table.add_column("Role", style="yellow")
+    agent_table.add_column("Confidence", style="green")
+    agent_table.add_column("Efficiency", style="blue")
+    agent_table.add_column("Fitness", style="red")
+    agent_table.add_column("Status", style="magenta")
+    
+    report_table = Table(title="Available Report Formats")
+    report_table.add_column("Format", style="cyan")
+    report_table.add_column("File Path", style="yellow")
+    report_table.add_column("Size", style="magenta", justify="right")
+    report_table.add_column("Description", style="green")
+    
+    return metrics_table, agent_table, report_table
+
+def _json_output(force_rich: bool) -> bool:
+    """Whether stdout is piped or redirected and should carry only the JSON summary"""
+    return not force_rich and not sys.stdout.isatty()
+
+async def run_with_comprehensive_reports(task: str = None, use_cache: bool = False, force_rich: bool = False):
+    """Run SEFAS with comprehensive reporting demonstration
+    
+    The agent system is only built when the task actually runs. With use_cache,
+    a result saved by an earlier successful run of the same task (under the
+    same agent config, model and hop limit) is shown instead of running the
+    agents again; a cached result only carries task_id, synthesis and reports.
+    When stdout is not a terminal the analysis is printed as one line of JSON
+    unless force_rich is set; the banner, status lines and runner output then
+    go to stderr so stdout stays parseable.
+    """
+    if not _json_output(force_rich):
+        return await _run_and_report(task, use_cache, json_stdout=None)
+    
+    json_stdout = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        return await _run_and_report(task, use_cache, json_stdout)
+
+async def _run_and_report(task, use_cache: bool, json_stdout):
+    """Body of run_with_comprehensive_reports; writes the JSON summary to json_stdout when it is set"""
     
     # Use a compelling default task if none provided
     if not task:
@@ -34,281 +162,295 @@ async def run_with_comprehensive_reports(task: str = None):
     ))
     
     console.print(f"\n[bold]📋 Task:[/bold] {task}")
-    console.print("[dim]Initializing federated agent system...[/dim]")
     
-    # Initialize runner
-    runner = FederatedSystemRunner()
-    
-    # Run task with full reporting
-    console.print("\n[bold green]🚀 Executing multi-agent analysis...[/bold green]")
+    cache_path = _result_cache_path(task) if use_cache else None
+    result = await asyncio.to_thread(_load_cached_result, cache_path) if use_cache else None
     
     try:
-        result = await runner.run(task)
-        
-        # Display comprehensive analysis
-        if 'synthesis' in result and result['synthesis']:
-            synthesis = result['synthesis']
-            
-            # Header
-            console.print("\n" + "="*80)
-            console.print("[bold blue]📊 COMPREHENSIVE SEFAS ANALYSIS COMPLETE[/bold blue]")
-            console.print("="*80)
-            
-            # Executive Summary Panel
-            exec_summary = synthesis.get('executive_summary', 'No summary available')
-            console.print(Panel(
-                exec_summary,
-                title="📋 Executive Summary",
-                border_style="green"
-            ))
-            
-            # System Performance Overview
-            performance = synthesis.get('performance', {})
-            consensus = synthesis.get('consensus', {})
-            
-            overview_text = Text()
-            overview_text.append("🎯 Consensus: ", style="bold")
-            if consensus.get('consensus_reached', False):
-                overview_text.append("✅ ACHIEVED", style="bold green")
-            else:
-                overview_text.append("🔄 PENDING", style="bold yellow")
-            
-            overview_text.append(f" ({consensus.get('mean_confidence', 0.0):.1%} confidence)\n", style="dim")
-            overview_text.append("⚡ Performance: ", style="bold")
-            overview_text.append(f"{performance.get('total_execution_time', 0.0):.1f}s", style="cyan")
-            overview_text.append(" | ", style="dim")
-            overview_text.append(f"{performance.get('total_tokens_used', 0):,} tokens", style="magenta")
-            overview_text.append(" | ", style="dim")
-            overview_text.append(f"${performance.get('estimated_cost_usd', 0.0):.4f}", style="green")
-            
-            console.print(Panel(overview_text, title="🎯 System Overview", border_style="cyan"))
-            
-            # Detailed Metrics Table
-            console.print("\n[bold]📈 Detailed Performance Metrics[/bold]")
-            
-            metrics_table = Table(title="Multi-Agent System Analysis", show_header=True)
-            metrics_table.add_column("Category", style="cyan", width=20)
-            metrics_table.add_column("Metric", style="yellow", width=25)
-            metrics_table.add_column("Value", style="magenta", width=15)
-            metrics_table.add_column("Quality", style="green", width=10)
-            
-            proposals = synthesis.get('proposals', {})
-            verification = synthesis.get('verification', {})
-            evolution = synthesis.get('evolution', {})
-            
-            # Add metrics with quality indicators
-            metrics_table.add_row(
-                "Consensus", "Mean Confidence", 
-                f"{consensus.get('mean_confidence', 0.0):.1%}",
-                "🟢 High" if consensus.get('mean_confidence', 0.0) > 0.8 else "🟡 Med" if consensus.get('mean_confidence', 0.0) > 0.5 else "🔴 Low"
-            )
-            metrics_table.add_row(
-                "Proposals", "Total Generated", 
-                str(proposals.get('total_proposals', 0)),
-                "🟢 Good" if proposals.get('total_proposals', 0) > 5 else "🟡 Fair" if proposals.get('total_proposals', 0) > 2 else "🔴 Limited"
-            )
-            metrics_table.add_row(
-                "Evolution", "Agents Evolved", 
-                str(len(evolution.get('evolved_agents', []))),
-                "🟢 Active" if len(evolution.get('evolved_agents', [])) > 0 else "🟡 Stable"
-            )
-            metrics_table.add_row(
-                "Performance", "Cost Efficiency", 
-                f"${performance.get('estimated_cost_usd', 0.0):.4f}",
-                "🟢 Efficient" if performance.get('estimated_cost_usd', 0.0) < 0.01 else "🟡 Moderate" if performance.get('estimated_cost_usd', 0.0) < 0.05 else "🔴 High"
-            )
-            
-            console.print(metrics_table)
-            
-            # Direct User-Friendly Answer Display - Using Available Synthesis Data
-            from rich.panel import Panel
-            
-            # Get data that's already available in synthesis
-            executive_summary = synthesis.get('executive_summary', 'Analysis completed successfully.')
-            recommendations = synthesis.get('recommendations', [])
-            mean_confidence = consensus.get('mean_confidence', 0.0)
-            consensus_reached = consensus.get('consensus_reached', False)
-            
-            # Style the confidence level
-            if mean_confidence > 0.8:
-                confidence_style = "bold green"
-                confidence_emoji = "✨"
-            elif mean_confidence > 0.6:
-                confidence_style = "bold yellow"
-                confidence_emoji = "⚡"
-            else:
-                confidence_style = "bold red"
-                confidence_emoji = "⚠️"
-            
-            # Format top recommendations
-            top_recommendations = []
-            for i, rec in enumerate(recommendations[:3], 1):
-                rec_text = rec.get('recommendation', 'No recommendation text')
-                top_recommendations.append(f"  {i}. {rec_text}")
-            
-            recommendations_text = "\n".join(top_recommendations) if top_recommendations else "  • No specific recommendations available"
+        if result is not None:
+            console.print(f"[dim]Using cached result from {cache_path} (run without --cache to re-run)[/dim]")
+        else:
+            console.print("[dim]Initializing federated agent system...[/dim]")
             
-            # Create the answer content using available data
-            answer_content = f"""🎯 **ANSWER TO YOUR QUESTION**
-
-❓ **Question:** {task}
-
-💡 **Analysis Summary:**
-{executive_summary}
-
-📊 **System Confidence:** {mean_confidence:.1%}
-
-💫 **Key Recommendations:**
-{recommendations_text}
-
-✅ **Consensus Status:** {'Reached - High agreement among agents' if consensus_reached else 'Partial - Agents still analyzing'}
-
-🤖 **Agent Network:** {len(synthesis.get('agent_contributions', {}))} specialized agents analyzed this request"""
+            # Initialize runner
+            runner = FederatedSystemRunner()
             
-            # Create prominent answer panel
-            answer_panel = Panel(
-                answer_content,
-                title=f"[bold blue]🎯 DIRECT ANSWER TO YOUR QUESTION[/bold blue]",
-                subtitle=f"[{confidence_style}]{confidence_emoji} {mean_confidence:.1%} Confidence[/{confidence_style}]",
-                border_style="blue",
-                padding=(1, 2),
-                expand=False
-            )
+            # Run task with full reporting
+            console.print("\n[bold green]🚀 Executing multi-agent analysis...[/bold green]")
+            result = await runner.run(task)
             
-            console.print("\n")
-            console.print(answer_panel)
-            console.print("\n")
+            # Only complete analyses are worth replaying
+            if use_cache and result.get('synthesis') and 'error' not in result:
+                await asyncio.to_thread(_store_cached_result, cache_path, result)
+        
+        synthesis = result.get('synthesis')
+        if not synthesis:
+            console.print("\n[bold red]❌ No comprehensive analysis available[/bold red]")
+            console.print("The system may have encountered issues during execution.")
+            return result
+        
+        # Display comprehensive analysis
+        performance = synthesis.get('performance', {})
+        consensus = synthesis.get('consensus', {})
+        # Values used by several sections below, looked up once
+        mean_confidence = consensus.get('mean_confidence', 0.0)
+        consensus_reached = consensus.get('consensus_reached', False)
+        cost = performance.get('estimated_cost_usd', 0.0)
+        total_time = performance.get('total_execution_time', 0.0)
+        total_tokens = performance.get('total_tokens_used', 0)
+        recommendations = synthesis.get('recommendations', [])
+        agent_contributions = synthesis.get('agent_contributions', {})
+        
+        # Piped or redirected output: a compact JSON summary instead of the Rich report
+        if json_stdout is not None:
+            print(json.dumps({
+                'task_id': result.get('task_id'),
+                'summary': synthesis.get('executive_summary', 'No summary available'),
+                'confidence': mean_confidence,
+                'consensus_reached': consensus_reached,
+                'recommendations': recommendations[:5],
+                'reports': result.get('reports', {}),
+            }, default=str), file=json_stdout)
+            return result
+        
+        metrics_table, agent_table, report_table = _build_result_tables()
+        
+        # Collected and printed once as a Group at the end
+        parts = []
+        
+        # Header
+        parts.append("\n" + "="*80)
+        parts.append("[bold blue]📊 COMPREHENSIVE SEFAS ANALYSIS COMPLETE[/bold blue]")
+        parts.append("="*80)
+        
+        # Executive Summary Panel
+        exec_summary = synthesis.get('executive_summary', 'No summary available')
+        parts.append(Panel(
+            exec_summary,
+            title="📋 Executive Summary",
+            border_style="green"
+        ))
+        
+        # System Performance Overview
+        overview_text = Text()
+        overview_text.append("🎯 Consensus: ", style="bold")
+        if consensus_reached:
+            overview_text.append("✅ ACHIEVED", style="bold green")
+        else:
+            overview_text.append("🔄 PENDING", style="bold yellow")
+        
+        overview_text.append(f" ({mean_confidence:.1%} confidence)\n", style="dim")
+        overview_text.append("⚡ Performance: ", style="bold")
+        overview_text.append(f"{total_time:.1f}s", style="cyan")
+        overview_text.append(" | ", style="dim")
+        overview_text.append(f"{total_tokens:,} tokens", style="magenta")
+        overview_text.append(" | ", style="dim")
+        overview_text.append(f"${cost:.4f}", style="green")
+        
+        parts.append(Panel(overview_text, title="🎯 System Overview", border_style="cyan"))
+        
+        # Detailed Metrics Table
+        parts.append("\n[bold]📈 Detailed Performance Metrics[/bold]")
+        
+        proposals = synthesis.get('proposals', {})
+        verification = synthesis.get('verification', {})
+        evolution = synthesis.get('evolution', {})
+        
+        # Add metrics with quality indicators
+        total_proposals = proposals.get('total_proposals', 0)
+        evolved_count = len(evolution.get('evolved_agents', []))
+        metrics_table.add_row(
+            "Consensus", "Mean Confidence", 
+            f"{mean_confidence:.1%}",
+            _ladder_label(mean_confidence, _CONFIDENCE_QUALITY, "🔴 Low")
+        )
+        metrics_table.add_row(
+            "Proposals", "Total Generated", 
+            str(total_proposals),
+            _ladder_label(total_proposals, _PROPOSAL_QUALITY, "🔴 Limited")
+        )
+        metrics_table.add_row(
+            "Evolution", "Agents Evolved", 
+            str(evolved_count),
+            "🟢 Active" if evolved_count > 0 else "🟡 Stable"
+        )
+        metrics_table.add_row(
+            "Performance", "Cost Efficiency", 
+            f"${cost:.4f}",
+            "🟢 Efficient" if cost < 0.01 else "🟡 Moderate" if cost < 0.05 else "🔴 High"
+        )
+        
+        parts.append(metrics_table)
+        
+        # Direct User-Friendly Answer Display - Using Available Synthesis Data
+        # Get data that's already available in synthesis
+        executive_summary = synthesis.get('executive_summary', 'Analysis completed successfully.')
+        
+        # Style the confidence level
+        if mean_confidence > 0.8:
+            confidence_style = "bold green"
+            confidence_emoji = "✨"
+        elif mean_confidence > 0.6:
+            confidence_style = "bold yellow"
+            confidence_emoji = "⚡"
+        else:
+            confidence_style = "bold red"
+            confidence_emoji = "⚠️"
+        
+        # Format top recommendations
+        recommendations_text = "\n".join(
+            f"  {i}. {rec.get('recommendation', 'No recommendation text')}"
+            for i, rec in enumerate(islice(recommendations, 3), 1)
+        ) or "  • No specific recommendations available"
+        
+        # Create the answer content using available data; one Text per block, and
+        # task/summary text is kept literal rather than parsed as markup
+        answer_content = Group(
+            Text("🎯 **ANSWER TO YOUR QUESTION**"),
+            Text(),
+            Text.assemble("❓ **Question:** ", task),
+            Text(),
+            Text("💡 **Analysis Summary:**"),
+            Text(executive_summary),
+            Text(),
+            Text(f"📊 **System Confidence:** {mean_confidence:.1%}"),
+            Text(),
+            Text("💫 **Key Recommendations:**"),
+            Text(recommendations_text),
+            Text(),
+            Text(f"✅ **Consensus Status:** {'Reached - High agreement among agents' if consensus_reached else 'Partial - Agents still analyzing'}"),
+            Text(),
+            Text(f"🤖 **Agent Network:** {len(agent_contributions)} specialized agents analyzed this request"),
+        )
+        
+        # Create prominent answer panel
+        answer_panel = Panel(
+            answer_content,
+            title=f"[bold blue]🎯 DIRECT ANSWER TO YOUR QUESTION[/bold blue]",
+            subtitle=f"[{confidence_style}]{confidence_emoji} {mean_confidence:.1%} Confidence[/{confidence_style}]",
+            border_style="blue",
+            padding=(1, 2),
+            expand=False
+        )
+        
+        parts.append("\n")
+        parts.append(answer_panel)
+        parts.append("\n")
+        
+        # Agent Performance Analysis
+        if agent_contributions:
+            parts.append("\n[bold]🤖 Individual Agent Analysis[/bold]")
             
-            # Agent Performance Analysis
-            agent_contributions = synthesis.get('agent_contributions', {})
-            if agent_contributions:
-                console.print("\n[bold]🤖 Individual Agent Analysis[/bold]")
-                
-                agent_table = Table(title="Agent Performance Breakdown")
-                agent_table.add_column("Agent ID", style="cyan")
-                agent_table.add_column("Role", style="yellow")
-                agent_table.add_column("Confidence", style="green")
-                agent_table.add_column("Efficiency", style="blue")
-                agent_table.add_column("Fitness", style="red")
-                agent_table.add_column("Status", style="magenta")
+            for agent_id, contrib in islice(agent_contributions.items(), 10):
+                conf = contrib['confidence']
+                fit = contrib['fitness_score']
                 
-                for agent_id, contrib in list(agent_contributions.items())[:10]:
-                    # Calculate efficiency (tokens per second)
-                    efficiency = contrib['tokens_used'] / max(contrib['execution_time'], 0.1)
-                    
-                    # Determine status
-                    if contrib['confidence'] > 0.8 and contrib['fitness_score'] > 0.7:
-                        status = "🌟 Excellent"
-                    elif contrib['confidence'] > 0.6 and contrib['fitness_score'] > 0.5:
-                        status = "✅ Good"
-                    elif contrib['confidence'] > 0.4:
-                        status = "🟡 Fair"
-                    else:
-                        status = "🔴 Needs Review"
-                    
-                    agent_table.add_row(
-                        agent_id[:12] + "..." if len(agent_id) > 12 else agent_id,
-                        contrib['role'][:15] + "..." if len(contrib['role']) > 15 else contrib['role'],
-                        f"{contrib['confidence']:.1%}",
-                        f"{efficiency:.0f}t/s",
-                        f"{contrib['fitness_score']:.1%}",
-                        status
-                    )
+                # Calculate efficiency (tokens per second)
+                efficiency = contrib['tokens_used'] / max(contrib['execution_time'], 0.1)
                 
-                console.print(agent_table)
-            
-            # Strategic Recommendations
-            recommendations = synthesis.get('recommendations', [])
-            if recommendations:
-                console.print("\n[bold]💡 Strategic Recommendations[/bold]")
+                # Determine status
+                status = next(
+                    (label for min_conf, min_fit, label in _AGENT_STATUS if conf > min_conf and fit > min_fit),
+                    _AGENT_STATUS_DEFAULT,
+                )
                 
-                for i, rec in enumerate(recommendations[:5], 1):
-                    source = rec.get('source', 'Unknown')
-                    confidence = rec.get('confidence', 0.0)
-                    recommendation = rec.get('recommendation', '')
-                    
-                    # Color code by confidence
-                    if confidence > 0.8:
-                        style = "green"
-                    elif confidence > 0.6:
-                        style = "yellow"
-                    else:
-                        style = "red"
-                    
-                    console.print(f"  {i}. [{style}]{source}[/{style}] ({confidence:.1%}): {recommendation}")
+                agent_table.add_row(
+                    agent_id[:12] + "..." if len(agent_id) > 12 else agent_id,
+                    contrib['role'][:15] + "..." if len(contrib['role']) > 15 else contrib['role'],
+                    f"{conf:.1%}",
+                    f"{efficiency:.0f}t/s",
+                    f"{fit:.1%}",
+                    status
+                )
             
-            # Critical Issues Alert
-            critical_issues = verification.get('critical_issues', [])
-            if critical_issues:
-                console.print(Panel(
-                    "\n".join([f"• {issue.get('checker', 'Unknown')}: {issue.get('issue', '')}" 
-                             for issue in critical_issues[:3]]),
-                    title="⚠️ Critical Issues Requiring Attention",
-                    border_style="red"
-                ))
+            parts.append(agent_table)
+        
+        # Strategic Recommendations
+        if recommendations:
+            parts.append("\n[bold]💡 Strategic Recommendations[/bold]")
             
-            # Report Files Section
-            if 'reports' in result and result['reports']:
-                console.print("\n[bold]📄 Generated Comprehensive Reports[/bold]")
-                
-                report_table = Table(title="Available Report Formats")
-                report_table.add_column("Format", style="cyan")
-                report_table.add_column("File Path", style="yellow")
-                report_table.add_column("Description", style="green")
-                
-                format_descriptions = {
-                    'markdown': 'Detailed technical report with full analysis',
-                    'html': 'Interactive web report with styling and navigation',
-                    'json': 'Structured data for programmatic analysis'
-                }
-                
-                for format_type, filepath in result['reports'].items():
-                    description = format_descriptions.get(format_type, 'Comprehensive analysis report')
-                    report_table.add_row(
-                        format_type.upper(),
-                        str(Path(filepath).name),
-                        description
-                    )
+            for i, rec in enumerate(recommendations[:5], 1):
+                source = rec.get('source', 'Unknown')
+                confidence = rec.get('confidence', 0.0)
+                recommendation = rec.get('recommendation', '')
                 
-                console.print(report_table)
+                # Color code by confidence
+                style = _ladder_label(confidence, _RECOMMENDATION_STYLE, "red")
                 
-                # Auto-open HTML report
-                if 'html' in result['reports']:
-                    html_path = result['reports']['html']
-                    try:
-                        webbrowser.open(f"file://{Path(html_path).absolute()}")
-                        console.print(Panel(
-                            f"🌐 Interactive HTML report automatically opened in your browser!\n"
-                            f"📁 Full file path: {html_path}",
-                            title="Report Viewer",
-                            border_style="green"
-                        ))
-                    except Exception:
-                        console.print(Panel(
-                            f"💻 Please manually open: file://{Path(html_path).absolute()}",
-                            title="Manual Report Access",
-                            border_style="yellow"
-                        ))
+                parts.append(f"  {i}. [{style}]{source}[/{style}] ({confidence:.1%}): {recommendation}")
+        
+        # Critical Issues Alert
+        critical_issues = verification.get('critical_issues', [])
+        if critical_issues:
+            parts.append(Panel(
+                "\n".join([f"• {issue.get('checker', 'Unknown')}: {issue.get('issue', '')}" 
+                         for issue in critical_issues[:3]]),
+                title="⚠️ Critical Issues Requiring Attention",
+                border_style="red"
+            ))
+        
+        # Report Files Section
+        browser_task = None
+        if 'reports' in result and result['reports']:
+            parts.append("\n[bold]📄 Generated Comprehensive Reports[/bold]")
             
-            # Conclusion Summary
-            console.print("\n" + "="*80)
-            conclusion_text = Text()
-            conclusion_text.append("🎉 Analysis Complete! ", style="bold green")
-            conclusion_text.append(f"The federated agent system processed your task using ")
-            conclusion_text.append(f"{len(agent_contributions)} specialized agents ", style="bold cyan")
-            conclusion_text.append(f"and achieved ")
-            if consensus.get('consensus_reached', False):
-                conclusion_text.append("consensus ", style="bold green")
-            else:
-                conclusion_text.append("partial consensus ", style="bold yellow")
-            conclusion_text.append(f"with {consensus.get('mean_confidence', 0.0):.1%} confidence.")
+            # Stat the report files concurrently, off the event loop
+            file_info = await asyncio.gather(
+                *(asyncio.to_thread(_describe_report_file, fp) for fp in result['reports'].values())
+            )
+            for format_type, (name, size) in zip(result['reports'], file_info):
+                description = FORMAT_DESCRIPTIONS.get(format_type, 'Comprehensive analysis report')
+                report_table.add_row(
+                    format_type.upper(),
+                    name,
+                    f"{size / 1024:,.1f} KB",
+                    description
+                )
             
-            console.print(conclusion_text)
-            console.print("="*80)
+            parts.append(report_table)
             
+            # Auto-open HTML report; the browser launches in a thread while the report renders
+            if 'html' in result['reports']:
+                html_path = result['reports']['html']
+                html_uri = await asyncio.to_thread(lambda: Path(html_path).resolve().as_uri())
+                browser_task = asyncio.create_task(asyncio.to_thread(webbrowser.open, html_uri))
+                parts.append(Panel(
+                    f"🌐 Interactive HTML report opening in your browser!\n"
+                    f"📁 Full file path: {html_path}",
+                    title="Report Viewer",
+                    border_style="green"
+                ))
+        
+        # Conclusion Summary
+        parts.append("\n" + "="*80)
+        conclusion_text = Text()
+        conclusion_text.append("🎉 Analysis Complete! ", style="bold green")
+        conclusion_text.append(f"The federated agent system processed your task using ")
+        conclusion_text.append(f"{len(agent_contributions)} specialized agents ", style="bold cyan")
+        conclusion_text.append(f"and achieved ")
+        if consensus_reached:
+            conclusion_text.append("consensus ", style="bold green")
         else:
-            console.print("\n[bold red]❌ No comprehensive analysis available[/bold red]")
-            console.print("The system may have encountered issues during execution.")
+            conclusion_text.append("partial consensus ", style="bold yellow")
+        conclusion_text.append(f"with {mean_confidence:.1%} confidence.")
+        
+        parts.append(conclusion_text)
+        parts.append("="*80)
+        
+        # One layout pass and write for the whole report
+        console.print(Group(*parts))
+        
+        if browser_task is not None:
+            try:
+                opened = await browser_task
+            except Exception:
+                opened = False
+            if not opened:
+                console.print(Panel(
+                    f"💻 Please manually open: {html_uri}",
+                    title="Manual Report Access",
+                    border_style="yellow"
+                ))
         
     except Exception as e:
         console.print(f"\n[bold red]❌ Execution failed: {str(e)}[/bold red]")
@@ -318,14 +460,20 @@ async def run_with_comprehensive_reports(task: str = None):
 
 async def main():
     """Main entry point for comprehensive reporting demo"""
+    parser = argparse.ArgumentParser(description="SEFAS comprehensive reporting demo")
+    parser.add_argument("--cache", action="store_true",
+                        help=f"Reuse a result cached in {RESULT_CACHE_DIR} by an earlier run of the same task")
+    parser.add_argument("--force-rich", action="store_true",
+                        help="Print the full Rich report even when stdout is not a terminal")
+    args = parser.parse_args()
     
-    # You can customize the task here or use the compelling default
-    custom_task = input("\n🎯 Enter a custom task (or press Enter for default): ").strip()
+    # You can customize the task here or use the compelling default. With JSON
+    # output the prompt goes to stderr, like the rest of the interactive text
+    prompt_stream = sys.stderr if _json_output(args.force_rich) else sys.stdout
+    with contextlib.redirect_stdout(prompt_stream):
+        custom_task = input("\n🎯 Enter a custom task (or press Enter for default): ")
     
-    if custom_task:
-        await run_with_comprehensive_reports(custom_task)
-    else:
-        await run_with_comprehensive_reports()
+    await run_with_comprehensive_reports(custom_task.strip(), use_cache=args.cache, force_rich=args.force_rich)
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
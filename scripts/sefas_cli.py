@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Unified SEFAS CLI
+
+One entry point for running experiments and managing agents:
+
+    python scripts/sefas_cli.py exp run "Summarize the benefits of renewable energy"
+    python scripts/sefas_cli.py agents list-agents --detail
+
+Only the module behind the chosen command group is imported, so `agents`
+commands start as fast as scripts/manage_agents.py on its own.
+scripts/run_experiment.py and scripts/manage_agents.py keep working on their own.
+"""
+
+import importlib
+import sys
+
+# Command group -> module whose Typer `app` handles it
+SUBAPPS = {
+    "exp": "run_experiment",
+    "agents": "manage_agents",
+}
+
+_STATIC_HELP = """\
+Usage: sefas_cli.py [OPTIONS] COMMAND [ARGS]...
+
+  SEFAS command line interface
+
+Options:
+  -h, --help  Show this message and exit.
+
+Commands:
+  exp     Run SEFAS experiments
+  agents  View and modify agent configurations
+"""
+
+
+def main(argv=None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in SUBAPPS:
+        sys.stdout.write(_STATIC_HELP)
+        if argv and argv[0] not in ("--help", "-h"):
+            sys.stderr.write(f"Error: No such command '{argv[0]}'.\n")
+            sys.exit(2)
+        return
+    module = importlib.import_module(SUBAPPS[argv[0]])
+    module.app(args=argv[1:], prog_name=f"sefas_cli.py {argv[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -72,17 +72,20 @@ class BPConvergenceTestSuite:
         converged_runs = 0
         iteration_counts = []
         convergence_times = []
-        
+
+        # One engine for all runs; reset() clears it between trials
+        bp_engine = BeliefPropagationEngine(
+            damping_factor=0.8,
+            convergence_threshold=1e-4,
+            max_iterations=50
+        )
+
         for i in range(n_runs):
             if i % 10 == 0:
                 print(f"    Progress: {i}/{n_runs}")
-            
-            bp_engine = BeliefPropagationEngine(
-                damping_factor=0.8,
-                convergence_threshold=1e-4,
-                max_iterations=50
-            )
-            
+
+            bp_engine.reset()
+
             # Add test proposals
             await self._add_test_proposals(bp_engine)
             
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Belief Propagation Equivalence Check
+Runs seeded random scenarios through the NumPy iteration loop, the Numba kernel
+(when numba is installed) and a per-claim reference of the original dict loop,
+and fails if any of them disagree.
+"""
+
+import asyncio
+import logging
+import random
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from unittest import mock
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sefas.core import belief_propagation
+from sefas.core.belief_propagation import ALLOWED_PROPOSERS, BeliefPropagationEngine
+
+PROPOSERS = sorted(ALLOWED_PROPOSERS)
+TOLERANCE = 1e-9  # Numba's log/exp may differ from NumPy's in the last ulp
+
+
+def _reference_update_messages(engine: BeliefPropagationEngine):
+    """Original per-claim check-to-variable update"""
+    claim_validations: Dict[str, List[Dict[str, Any]]] = {}
+    for (claim_id, _, round_num), validation in engine.validator_messages.items():
+        if round_num >= max(0, engine.current_round - 1):
+            claim_validations.setdefault(claim_id, []).append(validation)
+
+    for claim_id, validations in claim_validations.items():
+        if claim_id not in engine.beliefs:
+            continue
+        node = engine.beliefs[claim_id]
+
+        total_llr = sum(v.get('llr', 0.0) for v in validations)
+        support_count = sum(v.get('verdict', 'abstain') == 'support' for v in validations)
+        reject_count = sum(v.get('verdict', 'abstain') == 'reject' for v in validations)
+        avg_llr = total_llr / len(validations)
+        consensus_strength = max(support_count, reject_count) / len(validations)
+
+        for content, current_conf in node.candidates.items():
+            if total_llr > 0.5 and consensus_strength > 0.6:
+                node.candidates[content] = min(0.95, current_conf * (1.0 + avg_llr * 0.2 * consensus_strength))
+            elif total_llr < -0.5 and consensus_strength > 0.6:
+                node.candidates[content] = max(0.05, current_conf * (1.0 + avg_llr * 0.2 * consensus_strength))
+            elif abs(total_llr) < 0.1 or consensus_strength < 0.4:
+                node.candidates[content] = max(0.05, min(0.95, current_conf + avg_llr * 0.05))
+            else:
+                node.candidates[content] = max(0.05, min(0.95, current_conf + avg_llr * 0.1 * consensus_strength))
+
+    engine.normalize_beliefs()
+
+
+def _reference_min_sum(engine: BeliefPropagationEngine):
+    """Original per-claim min-sum stabilization"""
+    for node in engine.beliefs.values():
+        if len(node.candidates) <= 1:
+            continue
+        logs = {content: np.log(p) if p > 0 else -1e10 for content, p in node.candidates.items()}
+        max_log = max(logs.values())
+        for content in node.candidates:
+            node.candidates[content] = np.exp(logs[content] - max_log)
+    engine.normalize_beliefs()
+
+
+async def reference_propagate(engine: BeliefPropagationEngine) -> Dict[str, Any]:
+    """Original dict-based propagate() loop, run on the engine's belief nodes in place"""
+    engine.oscillation_history = []
+    engine.adaptive_damping = engine.damping_factor
+    engine.patience_counter = 0
+    engine.last_delta = float('inf')
+    engine.current_round = 0
+    engine.normalize_beliefs()
+
+    converged = False
+    iteration = 0
+    while not converged and iteration < engine.max_iterations:
+        old_beliefs = {claim_id: dict(node.candidates) for claim_id, node in engine.beliefs.items()}
+        engine.current_round = iteration
+
+        _reference_update_messages(engine)
+        for claim_id, node in engine.beliefs.items():
+            for content in node.candidates:
+                node.candidates[content] = (
+                    engine.adaptive_damping * old_beliefs[claim_id][content]
+                    + (1 - engine.adaptive_damping) * node.candidates[content]
+                )
+        engine.normalize_beliefs()
+
+        for node in engine.beliefs.values():
+            if node.confidence >= engine.min_confidence:
+                node.converged = True
+
+        max_delta = max(
+            (abs(p - old_beliefs[claim_id][content])
+             for claim_id, node in engine.beliefs.items()
+             for content, p in node.candidates.items()),
+            default=0.0,
+        )
+        engine.oscillation_history.append(max_delta)
+
+        if engine._detect_oscillation():
+            engine.adaptive_damping = min(0.95, engine.adaptive_damping + 0.1)
+            _reference_min_sum(engine)
+
+        converged = engine._should_stop(max_delta, iteration)
+        iteration += 1
+
+    return {'iterations': iteration, 'converged': converged, 'final_damping': engine.adaptive_damping}
+
+
+async def numpy_propagate(engine: BeliefPropagationEngine) -> Dict[str, Any]:
+    """propagate() with the compiled kernel hidden, forcing the NumPy loop"""
+    with mock.patch.object(belief_propagation, '_compiled_iterate', return_value=None):
+        return await engine.propagate()
+
+
+async def run_scenario(seed: int, propagate: Callable) -> List[Dict[str, Any]]:
+    """Build a seeded engine, propagate over 1-3 rounds and snapshot every round"""
+    rng = random.Random(seed)
+    engine = BeliefPropagationEngine(
+        damping_factor=rng.choice([0.5, 0.7, 0.9]),
+        convergence_threshold=rng.choice([1e-3, 1e-12]),
+        max_iterations=rng.choice([8, 50]),
+        min_confidence=rng.choice([0.5, 0.7]),
+    )
+
+    snapshots = []
+    for _ in range(rng.randint(1, 3)):
+        for c in range(rng.randint(0, 6)):
+            for _ in range(rng.randint(1, 4)):
+                await engine.add_proposal(
+                    f"claim_{c}", f"content_{rng.randint(0, 3)}",
+                    rng.choice([rng.random(), rng.uniform(0.5, 1.5), 0.0]),
+                    rng.choice(PROPOSERS + ["intruder"]),
+                )
+        for c in range(rng.randint(0, 8)):
+            for v in range(rng.randint(0, 5)):
+                await engine.add_validation(f"claim_{c}", f"validator_{v}", {
+                    'verdict': rng.choice(['support', 'reject', 'abstain', 'unknown']),
+                    'confidence': rng.random(),
+                })
+
+        result = await propagate(engine)
+        snapshots.append({
+            'iterations': result['iterations'],
+            'converged': result['converged'],
+            'final_damping': result['final_damping'],
+            'current_round': engine.current_round,
+            'beliefs': {
+                claim_id: (dict(node.candidates), node.confidence, node.converged)
+                for claim_id, node in engine.beliefs.items()
+            },
+        })
+    return snapshots
+
+
+def compare(expected: List[Dict[str, Any]], actual: List[Dict[str, Any]]) -> List[str]:
+    """Describe every difference between two scenario snapshots"""
+    if len(expected) != len(actual):
+        return [f"{len(expected)} rounds vs {len(actual)}"]
+
+    problems = []
+    for round_num, (exp, act) in enumerate(zip(expected, actual)):
+        for key in ('iterations', 'converged', 'current_round'):
+            if exp[key] != act[key]:
+                problems.append(f"round {round_num} {key}: {exp[key]} vs {act[key]}")
+        if abs(exp['final_damping'] - act['final_damping']) > TOLERANCE:
+            problems.append(f"round {round_num} final_damping: {exp['final_damping']} vs {act['final_damping']}")
+        if exp['beliefs'].keys() != act['beliefs'].keys():
+            problems.append(f"round {round_num} claims: {sorted(exp['beliefs'])} vs {sorted(act['beliefs'])}")
+            continue
+
+        for claim_id, (exp_candidates, exp_conf, exp_converged) in exp['beliefs'].items():
+            act_candidates, act_conf, act_converged = act['beliefs'][claim_id]
+            if exp_converged != act_converged:
+                problems.append(f"round {round_num} {claim_id} converged: {exp_converged} vs {act_converged}")
+            if abs(exp_conf - act_conf) > TOLERANCE:
+                problems.append(f"round {round_num} {claim_id} confidence: {exp_conf} vs {act_conf}")
+            for content, p in exp_candidates.items():
+                if abs(p - act_candidates[content]) > TOLERANCE:
+                    problems.append(f"round {round_num} {claim_id}/{content}: {p} vs {act_candidates[content]}")
+    return problems
+
+
+async def main():
+    """Run the seeded equivalence check"""
+
+    import argparse
+    parser = argparse.ArgumentParser(description='BP Equivalence Check')
+    parser.add_argument('--n_runs', type=int, default=200, help='Number of seeded scenarios')
+    parser.add_argument('--seed', type=int, default=0, help='First scenario seed')
+
+    args = parser.parse_args()
+
+    # Oscillation and non-convergence warnings are expected in random scenarios
+    logging.disable(logging.WARNING)
+
+    paths = {'numpy': numpy_propagate}
+    if belief_propagation._compiled_iterate() is not None:
+        paths['numba'] = lambda engine: engine.propagate()
+    else:
+        print("⚠️  numba not installed - checking the NumPy loop only")
+
+    print("🧪 BP Equivalence Check")
+    print("=" * 60)
+
+    failures = 0
+    for seed in range(args.seed, args.seed + args.n_runs):
+        expected = await run_scenario(seed, reference_propagate)
+        for name, propagate in paths.items():
+            problems = compare(expected, await run_scenario(seed, propagate))
+            if problems:
+                failures += 1
+                print(f"❌ seed {seed} ({name} vs reference):")
+                for problem in problems[:5]:
+                    print(f"    {problem}")
+
+    checked = args.n_runs * len(paths)
+    print(f"\nCompared {checked} scenario runs ({', '.join(paths)}) against the reference loop")
+    if failures:
+        print(f"❌ {failures} RUNS DIVERGED FROM THE REFERENCE")
+        return 1
+    print("✅ ALL PATHS MATCH THE REFERENCE")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -4,10 +4,17 @@ Agent Factory for Dynamic Agent Creation
 Creates all 15 SEFAS agents dynamically from configuration with full LLM parameter control.
 """
 
-from typing import Dict, Any, Type, Optional
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Tuple, Type, Optional
+import json
 import yaml
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from sefas.agents.base import SelfEvolvingAgent
 from sefas.agents.proposers import ProposerAgent, CreativeProposer, AnalyticalProposer, ResearchProposer
 from sefas.agents.checkers import CheckerAgent, LogicChecker, SemanticChecker, ConsistencyChecker
@@ -170,6 +177,10 @@ class AgentFactory:
         self.config_path = Path(config_path)
         self.config = self._load_config()
         
+        # Set inside transaction(): saves are deferred until the block exits
+        self._deferred = False
+        self._dirty = False
+        
         # Agent type mappings for specialized implementations
         self.agent_type_mapping = {
             'orchestrator': OrchestratorAgent,
@@ -182,15 +193,80 @@ class AgentFactory:
             # All other agents use DynamicAgent
         }
     
+    @property
+    def cache_path(self) -> Path:
+        """JSON sidecar holding the last parsed YAML (e.g. agents.json.cache)"""
+        return self.config_path.with_suffix('.json.cache')
+    
     def _load_config(self) -> Dict[str, Any]:
-        """Load agent configuration from YAML file"""
+        """Load agent configuration, preferring the JSON cache while it is fresh"""
+        try:
+            yaml_mtime = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Agent configuration not found at {self.config_path}")
+        
+        try:
+            if self.cache_path.stat().st_mtime_ns >= yaml_mtime:
+                return json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache: fall back to the YAML
+        
+        return self.refresh_cache()
+    
+    def refresh_cache(self) -> Dict[str, Any]:
+        """Re-parse the YAML configuration and rewrite the JSON cache"""
         try:
             with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
         except FileNotFoundError:
             raise FileNotFoundError(f"Agent configuration not found at {self.config_path}")
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML configuration: {e}")
+        
+        self._write_cache(config)
+        return config
+    
+    def _write_cache(self, config: Dict[str, Any]) -> None:
+        """Best-effort write of the JSON cache; a read-only tree just skips it"""
+        try:
+            self.cache_path.write_text(json.dumps(config), encoding='utf-8')
+        except (OSError, TypeError, ValueError):
+            pass
+    
+    def _save_config(self) -> None:
+        """Write the configuration back to YAML (deferred inside transaction())"""
+        if self._deferred:
+            self._dirty = True
+            return
+        with open(self.config_path, 'w') as f:
+            yaml.dump(self.config, f, default_flow_style=False, sort_keys=False)
+        # Keep the JSON cache in step with the file we just wrote
+        self._write_cache(self.config)
+    
+    @contextmanager
+    def transaction(self) -> Iterator["AgentFactory"]:
+        """Group several config updates into a single YAML write on exit
+        
+        If the block raises, nothing is written (the in-memory config keeps
+        whatever updates were already applied).
+        """
+        if self._deferred:
+            # Nested transaction: the outermost one does the write
+            yield self
+            return
+        
+        self._deferred = True
+        try:
+            yield self
+        except BaseException:
+            self._dirty = False
+            raise
+        finally:
+            self._deferred = False
+        
+        if self._dirty:
+            self._dirty = False
+            self._save_config()
     
     def create_agent(self, agent_id: str, agent_config: Dict[str, Any]) -> SelfEvolvingAgent:
         """Create a single agent from configuration"""
@@ -259,14 +335,40 @@ class AgentFactory:
         
         # Save back to file
         try:
-            with open(self.config_path, 'w') as f:
-                yaml.dump(self.config, f, default_flow_style=False, sort_keys=False)
+            self._save_config()
             print(f"✅ Updated configuration for {agent_id}")
             return True
         except Exception as e:
             print(f"❌ Failed to save configuration: {e}")
             return False
     
+    def bulk_update_agent_config(self, updates_by_agent: Dict[str, Dict[str, Any]]) -> int:
+        """Update several agents and write the configuration file once.
+        
+        Returns the number of agents updated (0 if the save failed).
+        """
+        
+        agents = self.config.setdefault('agents', {})
+        updated = []
+        for agent_id, updates in updates_by_agent.items():
+            if agent_id not in agents:
+                print(f"Warning: Agent {agent_id} not found in configuration")
+                continue
+            agents[agent_id].update(updates)
+            updated.append(agent_id)
+        
+        if not updated:
+            return 0
+        
+        # Save back to file
+        try:
+            self._save_config()
+            print(f"✅ Updated configuration for {len(updated)} agents")
+            return len(updated)
+        except Exception as e:
+            print(f"❌ Failed to save configuration: {e}")
+            return 0
+    
     def get_topology(self) -> Dict[str, Any]:
         """Get agent network topology"""
         return self.config.get('topology', {})
@@ -279,12 +381,11 @@ class AgentFactory:
         """Get execution strategy configuration"""
         return self.config.get('execution', {})
     
-    def list_agents(self) -> Dict[str, Dict[str, Any]]:
-        """List all available agents with their key properties"""
+    def iter_agents(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (agent_id, key properties) pairs one agent at a time"""
         
-        agents_info = {}
         for agent_id, config in self.config.get('agents', {}).items():
-            agents_info[agent_id] = {
+            yield agent_id, {
                 'name': config.get('name', agent_id),
                 'role': config.get('role', 'unknown'),
                 'model': config.get('model', 'default'),
@@ -293,8 +394,10 @@ class AgentFactory:
                 'strategy': config.get('strategy', 'general'),
                 'specialization': config.get('specialization', 'adaptive')
             }
-        
-        return agents_info
+    
+    def list_agents(self) -> Dict[str, Dict[str, Any]]:
+        """List all available agents with their key properties"""
+        return dict(self.iter_agents())
     
     def clone_agent(self, source_agent_id: str, new_agent_id: str, modifications: Dict[str, Any] = None) -> bool:
         """Clone an existing agent with optional modifications"""
@@ -320,8 +423,7 @@ class AgentFactory:
         
         # Save configuration
         try:
-            with open(self.config_path, 'w') as f:
-                yaml.dump(self.config, f, default_flow_style=False, sort_keys=False)
+            self._save_config()
             print(f"✅ Cloned {source_agent_id} → {new_agent_id}")
             return True
         except Exception as e:
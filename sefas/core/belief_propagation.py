@@ -8,6 +8,7 @@ import logging
 import time
 from typing import Dict, List, Optional, Tuple, Any
 from collections import defaultdict
+from functools import lru_cache
 import numpy as np
 from pydantic import BaseModel, Field
 
@@ -35,6 +36,98 @@ class BeliefNode(BaseModel):
     evidence_count: int = 0
     converged: bool = False
 
+# Verdict codes and column dtypes of the validator message arrays:
+# (claim index, round, llr, verdict code)
+_VERDICT_CODES = {"support": 1, "reject": -1}
+_VALIDATION_DTYPES = (np.intp, np.intp, np.float64, np.int8)
+
+
+def _normalize_segments(values: np.ndarray, seg: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Array form of normalize_beliefs: scale down any claim whose max exceeds 1.0.
+    
+    Updates values in place and returns each claim's confidence (its max).
+    """
+    if not values.size:
+        return values
+    seg_max = np.maximum.reduceat(values, starts)
+    over = seg_max > 1.0
+    if over.any():
+        values *= np.divide(1.0, seg_max, out=np.ones_like(seg_max), where=over)[seg]
+        seg_max = np.maximum.reduceat(values, starts)
+    return seg_max
+
+
+def _apply_validation_messages(
+    values: np.ndarray,
+    seg: np.ndarray,
+    n_claims: int,
+    validations: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    current_round: int,
+) -> np.ndarray:
+    """Check-to-variable update: move every candidate of a validated claim by its LLR evidence.
+    
+    validations holds parallel (claim index, round, llr, verdict code) arrays;
+    only messages from the current or previous round are counted.
+    """
+    v_claim, v_round, v_llr, v_code = validations
+    mask = v_round >= max(0, current_round - 1)
+    if not values.size or not mask.any():
+        return values
+    
+    claims = v_claim[mask]
+    codes = v_code[mask]
+    total = np.bincount(claims, minlength=n_claims)
+    total_llr = np.bincount(claims, weights=v_llr[mask], minlength=n_claims)
+    support = np.bincount(claims, weights=(codes == 1).astype(np.float64), minlength=n_claims)
+    reject = np.bincount(claims, weights=(codes == -1).astype(np.float64), minlength=n_claims)
+    
+    validated = total > 0
+    counted = np.maximum(total, 1)
+    avg_llr = total_llr / counted
+    consensus_strength = np.maximum(support, reject) / counted
+    
+    # Same decision ladder as the per-claim rules, evaluated for all claims at once
+    strong = consensus_strength > 0.6
+    boost = (total_llr > 0.5) & strong
+    penalty = ~boost & (total_llr < -0.5) & strong
+    weak = ~boost & ~penalty & ((np.abs(total_llr) < 0.1) | (consensus_strength < 0.4))
+    
+    factor = (1.0 + avg_llr * 0.2 * consensus_strength)[seg]
+    updated = np.select(
+        [boost[seg], penalty[seg], weak[seg]],
+        [
+            np.minimum(0.95, values * factor),
+            np.maximum(0.05, values * factor),
+            np.clip(values + (avg_llr * 0.05)[seg], 0.05, 0.95),
+        ],
+        default=np.clip(values + (avg_llr * 0.1 * consensus_strength)[seg], 0.05, 0.95),
+    )
+    return np.where(validated[seg], updated, values)
+
+
+def _min_sum_segments(values: np.ndarray, seg: np.ndarray, starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Array form of the min-sum stabilization: rescale each multi-candidate claim by its max in log domain"""
+    if not values.size:
+        return values
+    logs = np.log(values, out=np.full_like(values, -1e10), where=values > 0)
+    stabilized = np.exp(logs - np.maximum.reduceat(logs, starts)[seg])
+    return np.where((counts > 1)[seg], stabilized, values)
+
+
+@lru_cache(maxsize=1)
+def _compiled_iterate():
+    """Numba-compiled iteration loop, or None when numba is not installed.
+    
+    Imported on first use so loading this module does not pay for numba; the
+    first call blocks while the kernel compiles or loads from the disk cache.
+    """
+    try:
+        from sefas.core.bp_kernels import bp_iterate_kernel
+    except ImportError:  # numba is an optional speedup for the BP iteration loop
+        return None
+    return bp_iterate_kernel
+
+
 class BeliefPropagationEngine:
     """
     Implements stabilized LDPC-style belief propagation for federated consensus.
@@ -63,7 +156,6 @@ class BeliefPropagationEngine:
         
         # Belief states
         self.beliefs: Dict[str, BeliefNode] = {}
-        self.messages: Dict[Tuple[str, str], Dict[str, float]] = defaultdict(dict)
         
         # CRITICAL FIX: Use keyed validator messages to prevent double-counting
         self.validator_messages: Dict[Tuple[str, str, int], Dict[str, Any]] = {}
@@ -71,7 +163,18 @@ class BeliefPropagationEngine:
         
         # Track propagation history
         self.propagation_history: List[Dict[str, Any]] = []
-        
+
+    def reset(self):
+        """Clear all claims, validations and history so the engine can be reused"""
+        self.beliefs.clear()
+        self.validator_messages.clear()
+        self.propagation_history.clear()
+        self.oscillation_history.clear()
+        self.adaptive_damping = self.damping_factor
+        self.patience_counter = 0
+        self.last_delta = float('inf')
+        self.current_round = 0
+
     async def add_proposal(self, claim_id: str, content: str, confidence: float, agent_id: str):
         """Add a proposal from an agent"""
         # CRITICAL DEBUG: Log all proposal attempts
@@ -171,37 +274,19 @@ class BeliefPropagationEngine:
         else:
             beliefs_log = self._copy_beliefs()
             
-        converged = False
-        iteration = 0
+        # Iterate on flat arrays; the belief nodes are updated once at the end
+        nodes, values, seg, starts, counts, validations = self._assemble_arrays()
+        if not _compiled_iterate.cache_info().currsize:
+            # First propagate() in this process: import and compile off the event loop
+            await asyncio.to_thread(_compiled_iterate)
+        iterate = _compiled_iterate()
+        if iterate is not None:
+            values, confidence, reached, iteration, converged = self._iterate_compiled(iterate, values, starts, counts, validations)
+        else:
+            values, confidence, reached, iteration, converged = self._iterate_arrays(values, seg, starts, counts, validations)
         
-        while not converged and iteration < self.max_iterations:
-            old_beliefs = self._copy_beliefs()
-            
-            # CRITICAL FIX: Increment round for validator tracking
-            self.current_round = iteration
-            
-            # Message passing phase with damping
-            await self._update_messages_with_damping(old_beliefs)
-            
-            # Belief update phase
-            self._update_beliefs()
-            
-            # Check convergence and oscillation
-            max_delta = self._compute_max_delta(old_beliefs)
-            self.oscillation_history.append(max_delta)
-            
-            # Detect oscillation and adapt
-            if self._detect_oscillation():
-                logger.warning(f"Oscillation detected at iteration {iteration}")
-                self.adaptive_damping = min(0.95, self.adaptive_damping + 0.1)
-                # Apply emergency stabilization
-                self._apply_min_sum_stabilization()
-            
-            # Early stopping with patience
-            converged = self._should_stop(max_delta, iteration)
-            
-            iteration += 1
-            logger.info(f"Iteration {iteration}: max_delta={max_delta:.6f}, damping={self.adaptive_damping:.2f}, converged={converged}")
+        if iteration:
+            self._store_arrays(nodes, values, confidence, reached)
         
         # Extract consensus
         consensus = self._extract_consensus()
@@ -238,79 +323,118 @@ class BeliefPropagationEngine:
             'final_damping': self.adaptive_damping
         }
     
-    async def _update_messages(self):
-        """Update messages between nodes (check-to-variable and variable-to-check)"""
-        # CRITICAL FIX: Use keyed validator messages to prevent double-counting
-        # Group by claim_id for processing
-        claim_validations = defaultdict(list)
+    def _iterate_arrays(self, values, seg, starts, counts, validations):
+        """NumPy iteration loop; returns (values, confidence, reached, iterations, converged)"""
+        n_claims = len(starts)
+        confidence = np.zeros(n_claims)
+        reached = np.zeros(n_claims, dtype=bool)
         
-        for (claim_id, validator_id, round_num), validation_data in self.validator_messages.items():
-            # Only use validations from current or recent rounds to avoid stale data
-            if round_num >= max(0, self.current_round - 1):
-                claim_validations[claim_id].append(validation_data)
+        converged = False
+        iteration = 0
         
-        # For each claim with validations, propagate influence to beliefs
-        for claim_id, validations in claim_validations.items():
-            if claim_id not in self.beliefs:
-                continue
-                
-            node = self.beliefs[claim_id]
+        while not converged and iteration < self.max_iterations:
+            old_values = values.copy()
             
-            # CRITICAL FIX: Use signed validation with LLR for proper belief propagation
-            total_llr = 0.0
-            support_count = 0
-            reject_count = 0
-            abstain_count = 0
-            total_validations = len(validations)
+            # CRITICAL FIX: Increment round for validator tracking
+            self.current_round = iteration
             
-            for validation in validations:
-                verdict = validation.get('verdict', 'abstain')
-                llr = validation.get('llr', 0.0)
-                
-                total_llr += llr
-                if verdict == "support":
-                    support_count += 1
-                elif verdict == "reject":
-                    reject_count += 1
-                else:
-                    abstain_count += 1
+            # Message passing phase with damping
+            values = _apply_validation_messages(values, seg, n_claims, validations, self.current_round)
+            _normalize_segments(values, seg, starts)
+            values = self.adaptive_damping * old_values + (1 - self.adaptive_damping) * values
+            confidence = _normalize_segments(values, seg, starts)
             
-            if total_validations > 0:
-                avg_llr = total_llr / total_validations
-                
-                # Calculate validation strength based on consensus
-                consensus_strength = max(support_count, reject_count) / total_validations
-                
-                # Update all candidates based on LLR-based validation
-                for content in node.candidates:
-                    current_conf = node.candidates[content]
-                    
-                    # Apply LLR influence with consensus weighting
-                    if total_llr > 0.5 and consensus_strength > 0.6:
-                        # Strong positive consensus - boost confidence
-                        boost_factor = 1.0 + (avg_llr * 0.2 * consensus_strength)
-                        node.candidates[content] = min(0.95, current_conf * boost_factor)
-                    elif total_llr < -0.5 and consensus_strength > 0.6:
-                        # Strong negative consensus - reduce confidence
-                        penalty_factor = 1.0 + (avg_llr * 0.2 * consensus_strength)  # avg_llr is negative
-                        node.candidates[content] = max(0.05, current_conf * penalty_factor)
-                    elif abs(total_llr) < 0.1 or consensus_strength < 0.4:
-                        # Weak or conflicted consensus - minimal change
-                        adjustment = avg_llr * 0.05
-                        node.candidates[content] = max(0.05, min(0.95, current_conf + adjustment))
-                    else:
-                        # Moderate consensus - apply proportional adjustment
-                        adjustment = avg_llr * 0.1 * consensus_strength
-                        node.candidates[content] = max(0.05, min(0.95, current_conf + adjustment))
-        
-        # Re-normalize after message passing
-        self.normalize_beliefs()
+            # Belief update phase
+            reached |= confidence >= self.min_confidence
+            
+            # Check convergence and oscillation
+            max_delta = float(np.max(np.abs(values - old_values))) if values.size else 0.0
+            self.oscillation_history.append(max_delta)
+            
+            # Detect oscillation and adapt
+            if self._detect_oscillation():
+                logger.warning(f"Oscillation detected at iteration {iteration}")
+                self.adaptive_damping = min(0.95, self.adaptive_damping + 0.1)
+                # Apply emergency stabilization
+                values = _min_sum_segments(values, seg, starts, counts)
+                confidence = _normalize_segments(values, seg, starts)
+            
+            # Early stopping with patience
+            converged = self._should_stop(max_delta, iteration)
+            
+            iteration += 1
+            logger.info(f"Iteration {iteration}: max_delta={max_delta:.6f}, damping={self.adaptive_damping:.2f}, converged={converged}")
+        
+        return values, confidence, reached, iteration, converged
+    
+    def _iterate_compiled(self, iterate, values, starts, counts, validations):
+        """Run the compiled kernel; same contract as _iterate_arrays"""
+        v_claim, v_round, v_llr, v_code = validations
+        (confidence, reached, deltas, dampings, oscillated,
+         converged, patience, last_delta) = iterate(
+            values, starts, counts, v_claim, v_round, v_llr, v_code,
+            self.adaptive_damping, self.min_confidence, self.convergence_threshold, self.max_iterations,
+        )
+        iteration = len(deltas)
+        
+        # Carry the loop state back and replay the per-iteration log lines
+        self.oscillation_history = deltas.tolist()
+        self.adaptive_damping = float(dampings[-1]) if iteration else self.adaptive_damping
+        self.patience_counter = int(patience)
+        self.last_delta = float(last_delta)
+        if iteration:
+            self.current_round = iteration - 1
+        for i, (max_delta, damping, oscillation) in enumerate(zip(self.oscillation_history, dampings.tolist(), oscillated.tolist())):
+            if oscillation:
+                logger.warning(f"Oscillation detected at iteration {i}")
+            logger.info(f"Iteration {i + 1}: max_delta={max_delta:.6f}, damping={damping:.2f}, converged={converged and i == iteration - 1}")
+        if converged and self.patience_counter >= 5:
+            logger.info(f"Early stopping: no improvement for {self.patience_counter} iterations")
+        
+        return values, confidence, reached, iteration, bool(converged)
+    
+    def _assemble_arrays(self):
+        """Flatten candidate confidences and validator messages into NumPy arrays.
+        
+        Candidates of the k-th claim occupy values[starts[k]:starts[k] + counts[k]]
+        and seg maps every candidate back to k. Claims without candidates are
+        left out, as no update touches them.
+        """
+        nodes = [node for node in self.beliefs.values() if node.candidates]
+        index = {node.claim_id: k for k, node in enumerate(nodes)}
+        
+        counts = np.fromiter((len(node.candidates) for node in nodes), dtype=np.intp, count=len(nodes))
+        starts = np.zeros(len(nodes), dtype=np.intp)
+        np.cumsum(counts[:-1], out=starts[1:])
+        seg = np.repeat(np.arange(len(nodes), dtype=np.intp), counts)
+        values = np.fromiter(
+            (p for node in nodes for p in node.candidates.values()),
+            dtype=np.float64,
+            count=int(counts.sum()),
+        )
+        
+        rows = [
+            (index[claim_id], round_num, message.get('llr', 0.0), _VERDICT_CODES.get(message.get('verdict', 'abstain'), 0))
+            for (claim_id, _, round_num), message in self.validator_messages.items()
+            if claim_id in index
+        ]
+        columns = zip(*rows) if rows else ((),) * len(_VALIDATION_DTYPES)
+        validations = tuple(np.array(column, dtype=dtype) for column, dtype in zip(columns, _VALIDATION_DTYPES))
+        return nodes, values, seg, starts, counts, validations
     
-    def _update_beliefs(self):
-        """Update beliefs based on messages"""
+    def _store_arrays(self, nodes: List[BeliefNode], values: np.ndarray, confidence: np.ndarray, reached: np.ndarray):
+        """Write the iterated arrays back into the belief nodes"""
+        flat = iter(values.tolist())
+        for node, node_confidence, node_reached in zip(nodes, confidence.tolist(), reached.tolist()):
+            for content in node.candidates:
+                node.candidates[content] = next(flat)
+            node.confidence = node_confidence
+            if node_reached:
+                node.converged = True
+        
+        # Claims without candidates keep their confidence; apply the same threshold
         for node in self.beliefs.values():
-            # Mark as converged if confidence exceeds threshold
-            if node.confidence >= self.min_confidence:
+            if not node.candidates and node.confidence >= self.min_confidence:
                 node.converged = True
     
     def _copy_beliefs(self) -> Dict[str, Dict[str, float]]:
@@ -320,23 +444,6 @@ class BeliefPropagationEngine:
             for claim_id, node in self.beliefs.items()
         }
     
-    def _compute_max_delta(self, old_beliefs: Dict) -> float:
-        """Compute maximum change in beliefs"""
-        max_delta = 0.0
-        
-        for claim_id, node in self.beliefs.items():
-            if claim_id not in old_beliefs:
-                continue
-                
-            old_candidates = old_beliefs[claim_id]
-            
-            for content, prob in node.candidates.items():
-                old_prob = old_candidates.get(content, 0.0)
-                delta = abs(prob - old_prob)
-                max_delta = max(max_delta, delta)
-        
-        return max_delta
-    
     def _extract_consensus(self) -> Dict[str, Dict]:
         """Extract consensus from converged beliefs"""
         consensus = {}
@@ -457,34 +564,6 @@ class BeliefPropagationEngine:
                     log_beliefs[claim_id][content] = np.log(prob)
         return log_beliefs
     
-    async def _update_messages_with_damping(self, old_beliefs: Dict[str, Dict[str, float]]):
-        """Update messages with adaptive damping for stability"""
-        # First, update messages normally
-        await self._update_messages()
-        
-        # Then apply damping to smooth changes
-        for claim_id, node in self.beliefs.items():
-            if claim_id not in old_beliefs:
-                continue
-                
-            old_candidates = old_beliefs[claim_id]
-            
-            for content in node.candidates:
-                if content in old_candidates:
-                    old_value = old_candidates[content]
-                    new_value = node.candidates[content]
-                    
-                    # Apply adaptive damping
-                    damped_value = (
-                        self.adaptive_damping * old_value +
-                        (1 - self.adaptive_damping) * new_value
-                    )
-                    
-                    node.candidates[content] = damped_value
-        
-        # Re-normalize after damping
-        self.normalize_beliefs()
-    
     def _detect_oscillation(self) -> bool:
         """Detect period-2 or period-3 oscillations in convergence"""
         if len(self.oscillation_history) < 6:
@@ -539,32 +618,3 @@ class BeliefPropagationEngine:
         
         self.last_delta = delta
         return False
-    
-    def _apply_min_sum_stabilization(self):
-        """Apply min-sum approximation for better numerical stability"""
-        for node in self.beliefs.values():
-            if len(node.candidates) <= 1:
-                continue
-            
-            # Convert to log domain temporarily
-            log_candidates = {}
-            for content, prob in node.candidates.items():
-                if prob > 0:
-                    log_candidates[content] = np.log(prob)
-                else:
-                    log_candidates[content] = -1e10
-            
-            # Apply min-sum approximation (take maximum in log domain)
-            max_log_prob = max(log_candidates.values())
-            
-            # Normalize in log domain
-            for content in log_candidates:
-                log_candidates[content] -= max_log_prob
-            
-            # Convert back to probability domain with better numerical stability
-            for content in node.candidates:
-                if content in log_candidates:
-                    node.candidates[content] = np.exp(log_candidates[content])
-            
-        # Re-normalize
-        self.normalize_beliefs()
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Numba-compiled form of the belief propagation iteration loop.
+
+Requires numba. sefas.core.belief_propagation imports this module on the
+first propagate() and falls back to its NumPy loop when the import fails.
+"""
+
+import numpy as np
+from numba import njit
+
+# fastmath stays off so results match the NumPy path. cache=True keeps the
+# machine code on disk, so later processes load it instead of recompiling.
+
+
+@njit(cache=True)
+def _normalize_kernel(values, starts, counts, confidence):
+    """Scalar form of _normalize_segments; writes each claim's max into confidence"""
+    for k in range(starts.shape[0]):
+        end = starts[k] + counts[k]
+        seg_max = values[starts[k]]
+        for i in range(starts[k] + 1, end):
+            seg_max = max(seg_max, values[i])
+        if seg_max > 1.0:
+            factor = 1.0 / seg_max
+            seg_max = values[starts[k]] * factor
+            for i in range(starts[k], end):
+                values[i] *= factor
+                seg_max = max(seg_max, values[i])
+        confidence[k] = seg_max
+
+
+@njit(cache=True)
+def _oscillation_kernel(history):
+    """Scalar form of _detect_oscillation over the delta history"""
+    if history.shape[0] < 6:
+        return False
+    recent = history[-6:]
+    if (abs(recent[0] - recent[2]) < 1e-6 and abs(recent[1] - recent[3]) < 1e-6 and
+            abs(recent[2] - recent[4]) < 1e-6 and abs(recent[3] - recent[5]) < 1e-6):
+        return True
+    if abs(recent[0] - recent[3]) < 1e-6 and abs(recent[1] - recent[4]) < 1e-6 and abs(recent[2] - recent[5]) < 1e-6:
+        return True
+    return np.var(recent[-4:]) < 1e-10
+
+
+# Compiled at import (or loaded from the disk cache) for the C-contiguous
+# arrays built by BeliefPropagationEngine._assemble_arrays:
+# (values, starts, counts, v_claim, v_round, v_llr, v_code,
+#  damping, min_confidence, convergence_threshold, max_iterations)
+@njit(
+    "(float64[::1], intp[::1], intp[::1], intp[::1], intp[::1], float64[::1], int8[::1],"
+    " float64, float64, float64, intp)",
+    cache=True,
+)
+def bp_iterate_kernel(values, starts, counts, v_claim, v_round, v_llr, v_code,
+                      damping, min_confidence, convergence_threshold, max_iterations):
+    """The whole propagate() iteration loop as scalar loops over int-indexed arrays.
+    
+    Mirrors the NumPy path step for step (validation update, normalization,
+    damping, oscillation check with min-sum stabilization, patience-based
+    stopping) so it can be compiled with Numba. values is updated in place.
+    Returns (confidence, reached, deltas, dampings, oscillated, converged,
+    patience, last_delta), with the per-iteration arrays cut to the
+    iterations actually run.
+    """
+    n_claims = starts.shape[0]
+    n_values = values.shape[0]
+    confidence = np.zeros(n_claims)
+    reached = np.zeros(n_claims, dtype=np.bool_)
+    deltas = np.zeros(max_iterations)
+    dampings = np.zeros(max_iterations)
+    oscillated = np.zeros(max_iterations, dtype=np.bool_)
+    total = np.zeros(n_claims)
+    total_llr = np.zeros(n_claims)
+    support = np.zeros(n_claims)
+    reject = np.zeros(n_claims)
+    old = np.empty(n_values)
+    
+    patience = 0
+    last_delta = np.inf
+    converged = False
+    iteration = 0
+    while not converged and iteration < max_iterations:
+        old[:] = values
+        
+        # Validator evidence from the current and previous round, per claim
+        total[:] = 0.0
+        total_llr[:] = 0.0
+        support[:] = 0.0
+        reject[:] = 0.0
+        min_round = max(0, iteration - 1)
+        for j in range(v_claim.shape[0]):
+            if v_round[j] >= min_round:
+                k = v_claim[j]
+                total[k] += 1.0
+                total_llr[k] += v_llr[j]
+                if v_code[j] == 1:
+                    support[k] += 1.0
+                elif v_code[j] == -1:
+                    reject[k] += 1.0
+        
+        for k in range(n_claims):
+            if total[k] == 0.0:
+                continue
+            avg_llr = total_llr[k] / total[k]
+            consensus_strength = max(support[k], reject[k]) / total[k]
+            for i in range(starts[k], starts[k] + counts[k]):
+                x = values[i]
+                if total_llr[k] > 0.5 and consensus_strength > 0.6:
+                    values[i] = min(0.95, x * (1.0 + avg_llr * 0.2 * consensus_strength))
+                elif total_llr[k] < -0.5 and consensus_strength > 0.6:
+                    values[i] = max(0.05, x * (1.0 + avg_llr * 0.2 * consensus_strength))
+                elif abs(total_llr[k]) < 0.1 or consensus_strength < 0.4:
+                    values[i] = max(0.05, min(0.95, x + avg_llr * 0.05))
+                else:
+                    values[i] = max(0.05, min(0.95, x + avg_llr * 0.1 * consensus_strength))
+        _normalize_kernel(values, starts, counts, confidence)
+        
+        for i in range(n_values):
+            values[i] = damping * old[i] + (1 - damping) * values[i]
+        _normalize_kernel(values, starts, counts, confidence)
+        
+        delta = 0.0
+        for k in range(n_claims):
+            if confidence[k] >= min_confidence:
+                reached[k] = True
+        for i in range(n_values):
+            delta = max(delta, abs(values[i] - old[i]))
+        deltas[iteration] = delta
+        
+        if _oscillation_kernel(deltas[:iteration + 1]):
+            oscillated[iteration] = True
+            damping = min(0.95, damping + 0.1)
+            for k in range(n_claims):
+                if counts[k] <= 1:
+                    continue
+                end = starts[k] + counts[k]
+                max_log = -np.inf
+                for i in range(starts[k], end):
+                    values[i] = np.log(values[i]) if values[i] > 0 else -1e10
+                    max_log = max(max_log, values[i])
+                for i in range(starts[k], end):
+                    values[i] = np.exp(values[i] - max_log)
+            _normalize_kernel(values, starts, counts, confidence)
+        
+        # Same rules as _should_stop
+        if delta < convergence_threshold:
+            converged = True
+        else:
+            if delta >= last_delta * 0.99:
+                patience += 1
+            else:
+                patience = 0
+            if patience >= 5:
+                converged = True
+            elif iteration >= 3:
+                last_delta = delta
+        
+        dampings[iteration] = damping
+        iteration += 1
+    
+    return (confidence, reached, deltas[:iteration], dampings[:iteration], oscillated[:iteration],
+            converged, patience, last_delta)
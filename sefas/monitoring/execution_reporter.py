@@ -3,7 +3,6 @@
 import json
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from pathlib import Path
 import time
 
 from rich.console import Console
@@ -15,13 +14,56 @@ from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn, T
 from config.settings import settings
 from sefas.monitoring.metrics import performance_tracker
 
+try:
+    import orjson
+
+    def _dump_report(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+except ImportError:  # orjson is an optional speedup
+    def _dump_report(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2, default=str).encode()
+
+# Static layout for the report tables: (title, [(header, column kwargs), ...]).
+# Rich tables are filled in place, so the layout is shared and each report
+# builds a fresh table from it.
+_TABLE_SCAFFOLDS = {
+    "summary": ("📊 Execution Summary", (
+        ("Metric", {"style": "cyan", "no_wrap": True}),
+        ("Value", {"style": "green"}),
+        ("Status", {"style": "yellow"}),
+    )),
+    "agents": ("🤖 Agent Performance Details", (
+        ("Agent ID", {"style": "cyan"}),
+        ("Role", {"style": "blue"}),
+        ("Time (s)", {"style": "green"}),
+        ("Tokens", {"style": "yellow"}),
+        ("Confidence", {"style": "red"}),
+        ("Status", {"style": "white"}),
+    )),
+}
+
+_REPORT_RULE = "=" * 80
+
+
+def _new_table(name: str) -> Table:
+    """Build an empty report table from its shared scaffold."""
+    title, columns = _TABLE_SCAFFOLDS[name]
+    table = Table(title=title, show_header=True, header_style="bold magenta")
+    for header, column_kwargs in columns:
+        table.add_column(header, **column_kwargs)
+    return table
+
 
 class ExecutionReporter:
     """Enhanced execution reporting with detailed analysis."""
     
     def __init__(self):
         self.console = Console()
-        self.reports_dir = Path(settings.data_dir) / "reports"
+        self.reports_dir = settings.data_path / "reports"
         self.reports_dir.mkdir(parents=True, exist_ok=True)
     
     def generate_execution_report(self, execution_result: Dict[str, Any], 
@@ -52,9 +94,9 @@ class ExecutionReporter:
     def display_execution_report(self, execution_result: Dict[str, Any]):
         """Display comprehensive execution report in terminal."""
         
-        self.console.print("\n" + "="*80)
+        self.console.print("\n" + _REPORT_RULE)
         self.console.print("[bold blue]🔍 SEFAS Execution Analysis Report[/bold blue]", justify="center")
-        self.console.print("="*80)
+        self.console.print(_REPORT_RULE)
         
         # Execution Summary
         self._display_execution_summary(execution_result)
@@ -216,10 +258,7 @@ class ExecutionReporter:
     
     def _display_execution_summary(self, result: Dict[str, Any]):
         """Display execution summary table."""
-        table = Table(title="📊 Execution Summary", show_header=True, header_style="bold magenta")
-        table.add_column("Metric", style="cyan", no_wrap=True)
-        table.add_column("Value", style="green")
-        table.add_column("Status", style="yellow")
+        table = _new_table("summary")
         
         # Status
         status = "✅ Success" if result.get('consensus', False) else "❌ Failed"
@@ -244,13 +283,7 @@ class ExecutionReporter:
         if not proposals and not verifications:
             return
         
-        table = Table(title="🤖 Agent Performance Details", show_header=True, header_style="bold magenta")
-        table.add_column("Agent ID", style="cyan")
-        table.add_column("Role", style="blue")
-        table.add_column("Time (s)", style="green")
-        table.add_column("Tokens", style="yellow")
-        table.add_column("Confidence", style="red")
-        table.add_column("Status", style="white")
+        table = _new_table("agents")
         
         # Add proposer data
         for proposal in proposals:
@@ -458,8 +491,7 @@ class ExecutionReporter:
         filename = f"execution_report_{task_id}_{timestamp}.json"
         
         filepath = self.reports_dir / filename
-        with open(filepath, 'w') as f:
-            json.dump(report_data, f, indent=2, default=str)
+        filepath.write_bytes(_dump_report(report_data))
         
         self.console.print(f"\n📄 Report saved: {filepath}")
 
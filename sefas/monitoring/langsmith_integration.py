@@ -3,6 +3,7 @@
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import logging
+import sys
 from dataclasses import dataclass
 
 try:
@@ -17,7 +18,11 @@ from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Traces are created in bulk; slotted instances drop the per-object __dict__
+# (dataclass slots need Python 3.10+)
+_TRACE_DATACLASS_OPTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_TRACE_DATACLASS_OPTS)
 class AgentTrace:
     """Represents a trace for an individual agent interaction."""
     agent_id: str
@@ -31,7 +36,7 @@ class AgentTrace:
     error_message: Optional[str] = None
     metadata: Dict[str, Any] = None
 
-@dataclass
+@dataclass(**_TRACE_DATACLASS_OPTS)
 class FederatedTrace:
     """Represents a complete federated system execution trace."""
     task_id: str